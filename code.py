@@ -24,14 +24,16 @@ import ssl
 import microcontroller
 import random
 import traceback
+import array
+from collections import namedtuple
 
 # Display
 import displayio
 import framebufferio
 import rgbmatrix
+import bitmaptools
 from adafruit_display_text import bitmap_label
 from adafruit_bitmap_font import bitmap_font
-from adafruit_display_shapes.line import Line
 from adafruit_display_shapes.triangle import Triangle
 import adafruit_imageload
 
@@ -129,6 +131,12 @@ class Layout:
 	ICON_TEST_ROW1_Y = 5
 	ICON_TEST_ROW2_Y = 17
 	ICON_TEST_NUMBER_Y_OFFSET = 17  # Below 23px tall icon
+	ICON_TEST_POSITIONS = (
+		(ICON_TEST_COL1_X, ICON_TEST_ROW1_Y),  # Left
+		(ICON_TEST_COL2_X, ICON_TEST_ROW1_Y),  # Center
+		(ICON_TEST_COL3_X, ICON_TEST_ROW1_Y),  # Right
+	)
+	ICON_NUMBER_X_OFFSET = (5,) * 10 + (3,) * 35  # By icon number 0-44: center single vs double digits
 	
 class DayIndicator:
 	SIZE = 4
@@ -166,6 +174,7 @@ class Timing:
 	MARKET_CACHE_GRACE_MINUTES = 90  # Show cached data for 1.5 hours after close (until 5:30pm ET)
 
 	FORECAST_UPDATE_INTERVAL = 900  # - 3 cycles
+	SCHEDULE_REFRESH_RETRY = 600  # 10 minutes between failed daily-refresh attempts
 	DAILY_RESET_HOUR = 3
 	DAILY_RESET_MINUTE_DEVICE1 = 0
 	DAILY_RESET_MINUTE_DEVICE2 = 2
@@ -190,7 +199,6 @@ class Timing:
 	CYCLES_FOR_MEMORY_REPORT = 100
 	CYCLES_FOR_CACHE_STATS = 50
 	
-	EVENT_CHUNK_SIZE = 60
 	EVENT_MEMORY_MONITORING = 600 # For long events (e.g. all day)
 	
 	# Event time filtering
@@ -227,6 +235,7 @@ class API:
 	
 	# HTTP Status codes
 	HTTP_OK = 200
+	HTTP_NOT_MODIFIED = 304
 	HTTP_SERVICE_UNAVAILABLE = 503
 	HTTP_BAD_REQUEST = 400
 	HTTP_UNAUTHORIZED = 401
@@ -235,15 +244,27 @@ class API:
 	HTTP_TOO_MANY_REQUESTS = 429
 	HTTP_INTERNAL_SERVER_ERROR = 500
 
+	# GitHub CSV downloads (bodies above the cap are rejected)
+	GITHUB_MAX_BYTES = 32768
+	GITHUB_CHUNK_SIZE = 1024
+
 ## CTA API Configuration
 class CTAAPI:
 	TIMEOUT = 10
 	# Train Tracker API
 	TRAIN_BASE_URL = "https://lapi.transitchicago.com/api/1.0"
 	TRAIN_ARRIVALS_ENDPOINT = "ttarrivals.aspx"
+	# Routes shown: rt -> (display abbreviation, minimum minutes away, Loop-bound only)
+	TRAIN_ROUTES = {
+		"Red": ("red", 14, False),  # Fullerton
+		"Brn": ("brn", 10, True),   # Diversey
+		"P": ("ppl", 10, True),     # Diversey
+	}
 	# Bus Tracker API
 	BUS_BASE_URL = "http://www.ctabustracker.com/bustime/api/v2"
 	BUS_PREDICTIONS_ENDPOINT = "getpredictions"
+	# Reuse the last predictions for this long (under a minute, so counts stay exact)
+	ARRIVAL_TTL_SECONDS = 30
 
 ## Error Handling & Recovery
 class Recovery:
@@ -268,11 +289,13 @@ class Recovery:
 class Memory:
 	ESTIMATED_TOTAL = 2000000           # ESTIMATED_TOTAL_MEMORY
 	SOCKET_CLEANUP_CYCLES = 3
+	GC_ALLOCATION_THRESHOLD = 4096      # maybe_gc() collects once this many bytes were allocated
 
 ## File Paths
 class Paths:
 	EVENTS_CSV = "events.csv"
 	STOCKS_CSV = "stocks.csv"
+	SCHEDULES_CSV = "schedules.csv"
 	FONT_BIG = "fonts/bigbit10-16.bdf"
 	FONT_SMALL = "fonts/tinybit6-16.bdf"
 
@@ -304,11 +327,11 @@ class Visual:
 	UV_BREAKPOINT_3 = 9
 	
 	# UV spacing positions
-	UV_SPACING_POSITIONS = [3, 7, 11]
+	UV_SPACING_POSITIONS = (3, 7, 11)
 	
 	# Humidity calculation
 	HUMIDITY_PERCENT_PER_PIXEL = 10    # 10% per pixel
-	HUMIDITY_SPACING_POSITIONS = [2, 5, 8, 11]  # Every 20%
+	HUMIDITY_SPACING_POSITIONS = (2, 5, 8, 11)  # Every 20%
 	
 	# Color test grid
 	COLOR_TEST_GRID_COLS = 3
@@ -366,6 +389,7 @@ class TestData:
 	}
 	
 	TEST_ICONS = [1, 2, 3] # If None, screen will batch through all icons
+	VALID_ICON_NUMBERS = tuple(i for i in range(1, 45) if i not in (9, 10, 27, 28))  # AccuWeather icons (no 9, 10, 27, 28)
 
 ## String Constants
 class Strings:
@@ -392,9 +416,14 @@ class Strings:
 	GITHUB_REPO_URL = os.getenv("GITHUB_REPO_URL")
 	STOCKS_CSV_URL = os.getenv("STOCKS_CSV_URL")
 	GITHUB_STOCKS_FILE = "stocks.csv"  # Stocks file in GitHub repo
+	MATRIX_CONFIG_URLS = {
+		"type1": os.getenv("MATRIX1_CONFIG_URL"),
+		"type2": os.getenv("MATRIX2_CONFIG_URL"),
+	}
 
 	# Font test characters
 	FONT_METRICS_TEST_CHARS = "Aygjpq"
+	CLOCK_GLYPHS = "0123456789:APM "  # Preloaded so minute ticks never parse the BDF
 	DESCENDER_CHARS = {'g', 'j', 'p', 'q', 'y'}
 	
 	# Time format strings:
@@ -415,6 +444,14 @@ class DebugLevel:
 # Recommended for production
 CURRENT_DEBUG_LEVEL = DebugLevel.INFO
 
+# Resolved once so hot paths can skip building log strings that would be dropped
+INFO_ENABLED = CURRENT_DEBUG_LEVEL >= DebugLevel.INFO
+DEBUG_ENABLED = CURRENT_DEBUG_LEVEL >= DebugLevel.DEBUG
+VERBOSE_ENABLED = CURRENT_DEBUG_LEVEL >= DebugLevel.VERBOSE
+
+# Per-display memory checkpoints (gc.mem_free() is not free) - enable when chasing leaks
+DEBUG_MEMORY = False
+
 class DisplayConfig:
 	"""
 	Centralized display and feature control
@@ -522,10 +559,9 @@ def get_remaining_schedule_time(rtc, schedule_config):
 	"""Calculate how much time remains in the current schedule window"""
 	current = rtc.datetime
 	current_mins = current.tm_hour * 60 + current.tm_min
-	end_mins = schedule_config["end_hour"] * 60 + schedule_config["end_min"]
 	
 	# Calculate remaining minutes
-	remaining_mins = end_mins - current_mins
+	remaining_mins = schedule_config["end_mins"] - current_mins
 	
 	# Convert to seconds, with minimum of 1 minute
 	remaining_seconds = max(remaining_mins * 60, 60)
@@ -715,8 +751,9 @@ class ImageCache:
 		return f"Cache: {len(self.cache)} items, {hit_rate:.1f}% hit rate"
 		
 class TextWidthCache:
-		def __init__(self, max_size=50):
+		def __init__(self, max_size=128):
 			self.cache = {}  # (text, font_id) -> width
+			self.metrics_cache = {}  # (text, font_id) -> (font_height, baseline_offset)
 			self.max_size = max_size
 			self.hit_count = 0
 			self.miss_count = 0
@@ -746,6 +783,36 @@ class TextWidthCache:
 			self.cache[cache_key] = width
 			return width
 		
+		def get_font_metrics(self, text, font):
+			cache_key = (text, id(font))
+			
+			if cache_key in self.metrics_cache:
+				self.hit_count += 1
+				return self.metrics_cache[cache_key]
+			
+			# Cache miss - measure a temporary label
+			temp_label = bitmap_label.Label(font, text=text)
+			bbox = temp_label.bounding_box
+			
+			if bbox and len(bbox) >= 4:
+				# bbox format: (x, y, width, height)
+				font_height = bbox[3]  # Total height including ascenders/descenders
+				baseline_offset = abs(bbox[1]) if bbox[1] < 0 else 0  # How much above baseline
+				metrics = (font_height, baseline_offset)
+			else:
+				# Fallback if bbox is invalid
+				metrics = (8, 2)
+			
+			self.miss_count += 1
+			
+			# Evict oldest if cache full
+			if len(self.metrics_cache) >= self.max_size:
+				oldest_key = next(iter(self.metrics_cache))
+				del self.metrics_cache[oldest_key]
+			
+			self.metrics_cache[cache_key] = metrics
+			return metrics
+		
 		def get_stats(self):
 			total = self.hit_count + self.miss_count
 			hit_rate = (self.hit_count / total * 100) if total > 0 else 0
@@ -758,20 +825,30 @@ class MemoryMonitor:
 		self.peak_usage = 0
 		self.measurements = []
 		self.max_measurements = 5  # Reduced from 10
+		self.stats = {
+			"free_bytes": 0,
+			"used_bytes": 0,
+			"usage_percent": 0.0,
+			"free_percent": 0.0,
+		}
 		
-	def get_memory_stats(self):
-		"""Get current memory statistics with percentages"""
+	def fill_memory_stats(self, stats):
+		"""Write current memory statistics with percentages into stats (updated in place)"""
 		current_free = gc.mem_free()
 		current_used = Memory.ESTIMATED_TOTAL - current_free
-		usage_percent = (current_used / Memory.ESTIMATED_TOTAL) * 100
-		free_percent = (current_free / Memory.ESTIMATED_TOTAL) * 100
-		
-		return {
-			"free_bytes": current_free,
-			"used_bytes": current_used,
-			"usage_percent": usage_percent,
-			"free_percent": free_percent,
-		}
+		stats["free_bytes"] = current_free
+		stats["used_bytes"] = current_used
+		stats["usage_percent"] = (current_used / Memory.ESTIMATED_TOTAL) * 100
+		stats["free_percent"] = (current_free / Memory.ESTIMATED_TOTAL) * 100
+		return stats
+	
+	def get_memory_stats(self):
+		"""Get current memory statistics with percentages
+
+		Returns the monitor's shared stats dict, refreshed in place - read it right
+		away rather than holding on to it across calls.
+		"""
+		return self.fill_memory_stats(self.stats)
 	
 	def get_runtime(self):
 		"""Get runtime since startup"""
@@ -800,7 +877,7 @@ class MemoryMonitor:
 		# Only log if memory usage is concerning (>50%) or at VERBOSE level
 		if stats["usage_percent"] > 50:
 			log_warning(f"High memory: {stats['usage_percent']:.1f}% at {checkpoint_name}")
-		else:
+		elif VERBOSE_ENABLED:
 			log_verbose(f"Memory: {stats['usage_percent']:.1f}% at {checkpoint_name}")
 
 		return "ok"
@@ -969,7 +1046,9 @@ class WeatherDisplayState:
 		self.cached_current_weather_time = 0
 		self.cached_forecast_data = None
 		self.cached_events = None
+		self.active_events_cache = None  # (month, day, hour, events dict, count, active list), see get_today_events_info
 		self.cached_stocks = []
+		self.stock_display_name_map = {}  # {symbol: display_name}, rebuilt by set_cached_stocks()
 		self.cached_stock_prices = {}  # {symbol: {price, change_percent, direction, timestamp}}
 		self.last_stock_fetch_time = 0
 
@@ -979,11 +1058,18 @@ class WeatherDisplayState:
 		self.market_close_local_minutes = 0  # Market close time in local minutes (e.g., 3:00 PM = 900)
 		self.should_fetch_stocks = False  # Set once per cycle based on time check
 
-		self.cached_intraday_data = {}  # {symbol: {data: [...], timestamp: monotonic, open_price: float}}
-		self.last_intraday_fetch_time = {}  # {symbol: monotonic_timestamp}
+		self.cached_intraday_data = {}  # {symbol: {data: {datetime, close_price, session_open, session_date}, timestamp: monotonic}}
+		self.chart_bitmap = None  # Reused 2-color chart layer (see show_single_stock_chart)
+		self.chart_palette = None
+		self.chart_tile = None
+		self.cached_transit_arrivals = []  # Last CTA predictions (see CTAAPI.ARRIVAL_TTL_SECONDS)
+		self.last_transit_fetch_time = 0
 
 		# Colors (set after matrix detection)
 		self.colors = {}
+		self.label_pool = {}  # Reusable display labels by slot key (see get_pooled_label)
+		self.schedule_group = None  # Reused sub-group holding one schedule segment's items
+		self.color_lut = {}  # colors keyed by upper- and lowercase name (event CSV lookups)
 
 		# Network session
 		self.global_requests_session = None
@@ -994,6 +1080,7 @@ class WeatherDisplayState:
 
 		# Add memory monitor
 		self.memory_monitor = MemoryMonitor()
+		self.last_gc_free = gc.mem_free()  # Free bytes after the last maybe_gc() collection
 
 		# Schedule session tracking (for segmented displays)
 		self.active_schedule_name = None
@@ -1025,6 +1112,11 @@ state = WeatherDisplayState()
 bg_font = bitmap_font.load_font(Paths.FONT_BIG)
 font = bitmap_font.load_font(Paths.FONT_SMALL)
 
+# BDF glyphs load lazily on first use - pull in the clock characters now so
+# the forecast/schedule/clock update loops don't stall mid-display
+font.load_glyphs(Strings.CLOCK_GLYPHS)
+bg_font.load_glyphs(Strings.CLOCK_GLYPHS)
+
 ### ====================================== FUNCTIONS AND UTILITIES  ====================================== ###
 
 ### LOGGING UTILITIES ###
@@ -1090,7 +1182,7 @@ def log_debug(message):
 
 def log_verbose(message):
 	"""Log verbose message (extra detail)"""
-	if CURRENT_DEBUG_LEVEL >= DebugLevel.VERBOSE:
+	if VERBOSE_ENABLED:
 		log_entry(message, "DEBUG")  # Use DEBUG level for formatting
 		
 def duration_message(seconds):
@@ -1107,6 +1199,24 @@ def duration_message(seconds):
 		parts.append(f"{s} second{'s' if s != 1 else ''}")
 	
 	return " ".join(parts) if parts else "0 seconds"
+
+# Last formatted date: [(year, month, day), "YYYY-MM-DD"]
+_date_str_cache = [None, ""]
+
+def format_date_str(dt):
+	"""Format a struct_time as YYYY-MM-DD, only reformatting when the date changes"""
+	key = (dt.tm_year, dt.tm_mon, dt.tm_mday)
+	if key != _date_str_cache[0]:
+		_date_str_cache[0] = key
+		_date_str_cache[1] = "%04d-%02d-%02d" % key
+	return _date_str_cache[1]
+
+# Shared string pool (sys.intern is not available on CircuitPython)
+_intern_pool = {}
+
+def intern_str(text):
+	"""Return a shared copy of text so repeated parses reuse one string object"""
+	return _intern_pool.setdefault(text, text)
 		
 
 ### PARSING FUNCTIONS ###
@@ -1297,52 +1407,60 @@ def is_wifi_connected():
 		except:
 			return False
 
+# Offsets for the current UTC date, keyed by timezone name (DST only flips between days)
+_timezone_offset_date = None
+_timezone_offset_cache = {}
+
 def get_timezone_offset(timezone_name, utc_datetime):
+	"""Timezone offset including DST for a given timezone, computed once per timezone per day"""
+	global _timezone_offset_date
+	
+	date_key = (utc_datetime.tm_year, utc_datetime.tm_mon, utc_datetime.tm_mday)
+	if date_key != _timezone_offset_date:
+		_timezone_offset_cache.clear()
+		_timezone_offset_date = date_key
+	
+	offset = _timezone_offset_cache.get(timezone_name)
+	if offset is None:
+		offset = _calculate_timezone_offset(timezone_name, utc_datetime)
+		_timezone_offset_cache[timezone_name] = offset
+	return offset
+	
+def _calculate_timezone_offset(timezone_name, utc_datetime):
 	"""Calculate timezone offset including DST for a given timezone"""
 	
-	if timezone_name not in TIMEZONE_OFFSETS:
+	tz_info = TIMEZONE_OFFSETS.get(timezone_name)
+	if tz_info is None:
 		log_warning(f"Unknown timezone: {timezone_name}, using Chicago")
-		timezone_name = Strings.TIMEZONE_DEFAULT
-	
-	tz_info = TIMEZONE_OFFSETS[timezone_name]
+		tz_info = TIMEZONE_OFFSETS[Strings.TIMEZONE_DEFAULT]
 	
 	# If timezone doesn't observe DST
 	if tz_info["dst_start"] is None:
 		return tz_info["std"]
 	
 	# Check if DST is active
-	dst_active = is_dst_active_for_timezone(timezone_name, utc_datetime)
+	dst_active = _in_dst_window(tz_info, utc_datetime.tm_mon, utc_datetime.tm_mday)
 	return tz_info["dst"] if dst_active else tz_info["std"]
 	
 def is_dst_active_for_timezone(timezone_name, utc_datetime):
 	"""Check if DST is active for a specific timezone and date"""
 	
-	if timezone_name not in TIMEZONE_OFFSETS:
-		return False
-	
-	tz_info = TIMEZONE_OFFSETS[timezone_name]
+	tz_info = TIMEZONE_OFFSETS.get(timezone_name)
 	
-	# No DST for this timezone
-	if tz_info["dst_start"] is None:
+	# Unknown timezone, or no DST for this timezone
+	if tz_info is None or tz_info["dst_start"] is None:
 		return False
 	
-	month = utc_datetime.tm_mon
-	day = utc_datetime.tm_mday
+	return _in_dst_window(tz_info, utc_datetime.tm_mon, utc_datetime.tm_mday)
 	
+def _in_dst_window(tz_info, month, day):
+	"""Whether month/day falls in [dst_start, dst_end) - Northern Hemisphere (US/Europe)"""
 	dst_start_month, dst_start_day = tz_info["dst_start"]
 	dst_end_month, dst_end_day = tz_info["dst_end"]
 	
-	# DST logic for Northern Hemisphere (US/Europe)
-	if month < dst_start_month or month > dst_end_month:
-		return False
-	elif month > dst_start_month and month < dst_end_month:
-		return True
-	elif month == dst_start_month:
-		return day >= dst_start_day
-	elif month == dst_end_month:
-		return day < dst_end_day
-	
-	return False
+	# Compare (month, day) as a single integer (days never exceed 31)
+	date_key = month * 32 + day
+	return dst_start_month * 32 + dst_start_day <= date_key < dst_end_month * 32 + dst_end_day
 	
 def get_timezone_from_location_api():
 	"""Get timezone and location info from AccuWeather Location API"""
@@ -1405,8 +1523,7 @@ def sync_time_with_timezone(rtc):
 		# Use existing hardcoded logic
 		try:
 			cleanup_sockets()
-			pool = socketpool.SocketPool(wifi.radio)
-			ntp_utc = adafruit_ntp.NTP(pool, tz_offset=0)
+			ntp_utc = adafruit_ntp.NTP(get_socket_pool(), tz_offset=0)
 			utc_time = ntp_utc.datetime
 			offset = get_timezone_offset(timezone_name, utc_time)
 		except Exception as e:
@@ -1415,8 +1532,7 @@ def sync_time_with_timezone(rtc):
 	
 	try:
 		cleanup_sockets()
-		pool = socketpool.SocketPool(wifi.radio)
-		ntp = adafruit_ntp.NTP(pool, tz_offset=offset)
+		ntp = adafruit_ntp.NTP(get_socket_pool(), tz_offset=offset)
 		rtc.datetime = ntp.datetime
 		
 		log_info(f"Time synced to {timezone_name} (UTC{offset:+d})")
@@ -1464,18 +1580,24 @@ def cleanup_sockets():
 _global_socket_pool = None  # Socket pool created ONCE and reused
 _global_session = None
 
+def get_socket_pool():
+	"""Get or create the global socket pool (shared by HTTP and NTP)"""
+	global _global_socket_pool
+
+	# Create socket pool ONCE globally, reuse for all sessions
+	if _global_socket_pool is None:
+		_global_socket_pool = socketpool.SocketPool(wifi.radio)
+		log_debug("Created global socket pool")
+
+	return _global_socket_pool
+
 def get_requests_session():
 	"""Get or create the global requests session"""
-	global _global_session, _global_socket_pool
+	global _global_session
 
 	if _global_session is None:
 		try:
-			# Create socket pool ONCE globally, reuse for all sessions
-			if _global_socket_pool is None:
-				_global_socket_pool = socketpool.SocketPool(wifi.radio)
-				log_debug("Created global socket pool")
-
-			_global_session = requests.Session(_global_socket_pool, ssl.create_default_context())
+			_global_session = requests.Session(get_socket_pool(), ssl.create_default_context())
 			log_debug("Created new global session (reusing socket pool)")
 		except Exception as e:
 			log_error(f"Failed to create session: {e}")
@@ -1584,8 +1706,14 @@ def _process_response_status(response, context):
 		log_error(f"{context}: HTTP {status}")
 		return False
 
-def fetch_weather_with_retries(url, max_retries=None, context="API"):
-	"""Fetch weather with retries - defensive error handling"""
+def fetch_weather_with_retries(url, max_retries=None, context="API", conditional=False, parse=None):
+	"""Fetch weather with retries - defensive error handling
+
+	parse, if given, converts the JSON before it is returned. With conditional=True
+	the request carries the ETag / Last-Modified of the previous response and only
+	the parsed result is kept (not the raw JSON), so a 304 returns it without
+	downloading or parsing the body again.
+	"""
 	if max_retries is None:
 		max_retries = API.MAX_RETRIES
 
@@ -1607,7 +1735,10 @@ def fetch_weather_with_retries(url, max_retries=None, context="API"):
 		# Try to fetch - exception handling delegated to helper
 		response = None
 		try:
-			response = session.get(url)
+			if conditional:
+				response = session.get(url, headers=_conditional_get_headers(url))
+			else:
+				response = session.get(url)
 		except (RuntimeError, OSError) as e:
 			last_error = _handle_network_error(e, context, attempt, max_retries)
 			continue  # Retry
@@ -1620,11 +1751,29 @@ def fetch_weather_with_retries(url, max_retries=None, context="API"):
 
 		# Process and cleanup response
 		try:
+			# Unchanged since the last fetch - reuse the parsed copy
+			if conditional and response.status_code == API.HTTP_NOT_MODIFIED:
+				cached = _body_cache.get(url)
+				if cached is not None:
+					log_verbose(f"{context}: Not modified (304)")
+					return cached
+
+				# No copy to reuse - drop the validators so the retry is a full fetch
+				log_warning(f"{context}: 304 without a cached copy, refetching")
+				_etag_cache.pop(url, None)
+				_last_modified_cache.pop(url, None)
+				last_error = "HTTP 304 without cached copy"
+				continue
+
 			# Process response - status handling delegated to helper
 			result = _process_response_status(response, context)
 
 			# Success or permanent error
 			if result is not None and result is not False:
+				if parse is not None:
+					result = parse(result)
+				if conditional:
+					_remember_etag(url, response, result)
 				return result
 
 			# Permanent error (None from helper)
@@ -1707,7 +1856,7 @@ def parse_forecast_weather(forecast_json):
 		})
 
 	log_info(f"Forecast: {len(forecast_data)} hours (fresh) | Next: {forecast_data[0]['feels_like']}°C")
-	if len(forecast_data) >= forecast_fetch_length and CURRENT_DEBUG_LEVEL >= DebugLevel.VERBOSE:
+	if len(forecast_data) >= forecast_fetch_length and VERBOSE_ENABLED:
 		for h, item in enumerate(forecast_data):
 			log_verbose(f"  Hour {h+1}: {item['temperature']}°C, {item['weather_text']}")
 
@@ -1792,15 +1941,13 @@ def fetch_current_weather():
 		current_url = f"{API.BASE_URL}/{API.CURRENT_ENDPOINT}/{location}?apikey={api_key}&details=true"
 
 		# Fetch with retries (default: 3 retries)
-		current_json = fetch_weather_with_retries(current_url, context="Current Weather")
+		# (parsed in the helper so a 304 reuses the small parsed dict, not the raw JSON)
+		current_data = fetch_weather_with_retries(current_url, context="Current Weather", conditional=True, parse=parse_current_weather)
 
-		if current_json:
+		if current_data:
 			# Track successful API call
 			track_api_call_success("current")
 
-			# Parse the data
-			current_data = parse_current_weather(current_json)
-
 			# Cache for fallback
 			state.cached_current_weather = current_data
 			state.cached_current_weather_time = time.monotonic()
@@ -1976,23 +2123,35 @@ def should_fetch_forecast():
 	return (current_time - state.last_forecast_fetch) >= Timing.FORECAST_UPDATE_INTERVAL
 	
 def get_today_events_info(rtc):
-	"""Get information about today's ACTIVE events (filtered by time)"""
-	month_day = f"{rtc.datetime.tm_mon:02d}{rtc.datetime.tm_mday:02d}"
+	"""Get information about today's ACTIVE events (filtered by time)
+
+	Active events only change with the hour (or a reloaded events dict), so the
+	result is cached and repeat calls within the hour skip the filter.
+	"""
+	now = rtc.datetime
 	events = get_events()
 	
-	if month_day not in events:
-		return 0, []
+	cache = state.active_events_cache
+	if (cache is not None and cache[0] == now.tm_mon and cache[1] == now.tm_mday
+			and cache[2] == now.tm_hour and cache[3] is events):
+		return cache[4], cache[5]
 	
-	current_hour = rtc.datetime.tm_hour
+	month_day = f"{now.tm_mon:02d}{now.tm_mday:02d}"
 	
-	# Filter events by current time
-	active_events = [event for event in events[month_day] if is_event_active(event, current_hour)]
+	if month_day not in events:
+		active_events = []
+	else:
+		# Filter events by current time
+		current_hour = now.tm_hour
+		active_events = [event for event in events[month_day] if is_event_active(event, current_hour)]
 	
+	state.active_events_cache = (now.tm_mon, now.tm_mday, now.tm_hour, events, len(active_events), active_events)
 	return len(active_events), active_events
 	
 def get_today_all_events_info(rtc):
 	"""Get ALL events for today (not filtered by time)"""
-	month_day = f"{rtc.datetime.tm_mon:02d}{rtc.datetime.tm_mday:02d}"
+	now = rtc.datetime
+	month_day = f"{now.tm_mon:02d}{now.tm_mday:02d}"
 	events = get_events()
 	
 	if month_day not in events:
@@ -2028,6 +2187,14 @@ def get_matrix_colors():
 	
 	return ColorManager.generate_colors(matrix_type, bit_depth)
 
+def build_color_lut(colors):
+	"""Index colors by both upper- and lowercase name so lookups need no .upper()"""
+	lut = {}
+	for name, value in colors.items():
+		lut[name] = value
+		lut[name.lower()] = value
+	return lut
+
 def convert_bmp_palette(palette):
 	"""Convert BMP palette for RGB matrix display"""
 	if not palette or 'ColorConverter' in str(type(palette)):
@@ -2078,19 +2245,10 @@ def get_font_metrics(font, text="Aygjpq"):
 	"""
 	Calculate font metrics including ascenders and descenders
 	Uses test text with both tall and descending characters
+	Results are memoized per (text, font) in state.text_cache
 	"""
 	try:
-		temp_label = bitmap_label.Label(font, text=text)
-		bbox = temp_label.bounding_box
-		
-		if bbox and len(bbox) >= 4:
-			# bbox format: (x, y, width, height)
-			font_height = bbox[3]  # Total height including ascenders/descenders
-			baseline_offset = abs(bbox[1]) if bbox[1] < 0 else 0  # How much above baseline
-			return font_height, baseline_offset
-		else:
-			# Fallback if bbox is invalid
-			return 8, 2
+		return state.text_cache.get_font_metrics(text, font)
 	except Exception as e:
 		log_error(f"Font metrics error: {e}")
 		# Safe fallback values for small font
@@ -2130,14 +2288,16 @@ def normalize_date_key(date_str):
 	return date_key
 
 def parse_event_data(parts):
-	"""Extract event data fields from CSV parts. Returns [top_line, bottom_line, image, color, start_hour, end_hour]"""
+	"""Extract event data fields from CSV parts. Returns [top_line, bottom_line, image, color, start_hour, end_hour, image_path]"""
 	return [
 		parts[1],  # top_line
 		parts[2],  # bottom_line
 		parts[3],  # image
 		parts[4] if len(parts) > 4 and parts[4].strip() else Strings.DEFAULT_EVENT_COLOR,
 		int(parts[5]) if len(parts) > 5 and parts[5].strip() else Timing.EVENT_ALL_DAY_START,
-		int(parts[6]) if len(parts) > 6 and parts[6].strip() else Timing.EVENT_ALL_DAY_END
+		int(parts[6]) if len(parts) > 6 and parts[6].strip() else Timing.EVENT_ALL_DAY_END,
+		# Full bitmap path, built once here instead of on every display
+		Paths.BIRTHDAY_IMAGE if parts[1] == "Birthday" else f"{Paths.EVENT_IMAGES}/{parts[3]}"
 	]
 
 def load_events_from_file(filepath):
@@ -2146,28 +2306,31 @@ def load_events_from_file(filepath):
 	count = 0
 
 	try:
+		# One read and a C-level split instead of per-line buffered reads
 		with open(filepath, 'r') as f:
-			for line_num, line in enumerate(f, 1):
-				line = line.strip()
-				if not line or line.startswith("#"):
-					continue
+			lines = f.read().splitlines()
 
-				try:
-					parts = [p.strip() for p in line.split(",")]
+		for line_num, line in enumerate(lines, 1):
+			line = line.strip()
+			if not line or line.startswith("#"):
+				continue
 
-					# Format: MM-DD,TopLine,BottomLine,ImageFile,Color[,StartHour,EndHour]
-					if len(parts) < 4:
-						log_warning(f"Line {line_num}: Not enough fields (need at least 4)")
-						continue
+			try:
+				parts = [p.strip() for p in line.split(",")]
 
-					date_key = normalize_date_key(parts[0])
-					event_data = parse_event_data(parts)
-					events.setdefault(date_key, []).append(event_data)
-					count += 1
-					log_verbose(f"Loaded: {date_key} - {event_data[0]} {event_data[1]}")
+				# Format: MM-DD,TopLine,BottomLine,ImageFile,Color[,StartHour,EndHour]
+				if len(parts) < 4:
+					log_warning(f"Line {line_num}: Not enough fields (need at least 4)")
+					continue
 
-				except Exception as e:
-					log_warning(f"Line {line_num} parse error: {e} | Line: {line}")
+				date_key = normalize_date_key(parts[0])
+				event_data = parse_event_data(parts)
+				events.setdefault(date_key, []).append(event_data)
+				count += 1
+				log_verbose(f"Loaded: {date_key} - {event_data[0]} {event_data[1]}")
+
+			except Exception as e:
+				log_warning(f"Line {line_num} parse error: {e} | Line: {line}")
 
 		log_debug(f"Loaded {count} events from {filepath}")
 		return events, count
@@ -2208,7 +2371,7 @@ def is_event_active(event_data, current_hour):
 	Check if event should be displayed at current hour
 	
 	Args:
-		event_data: [top_line, bottom_line, image, color, start_hour, end_hour]
+		event_data: [top_line, bottom_line, image, color, start_hour, end_hour, image_path]
 		current_hour: Current hour (0-23)
 	
 	Returns:
@@ -2247,46 +2410,51 @@ def parse_events_csv_content(csv_content, rtc):
 	try:
 		# Get today's date for comparison
 		if rtc:
-			today_year = rtc.datetime.tm_year
-			today_month = rtc.datetime.tm_mon
-			today_day = rtc.datetime.tm_mday
+			now = rtc.datetime
+			today_year = now.tm_year
+			today_month = now.tm_mon
+			today_day = now.tm_mday
 		else:
 			# Fallback if RTC not available - import all
 			today_year = 1900
 			today_month = 1
 			today_day = 1
 
-		for line in csv_content.split('\n'):
+		for line in csv_content.splitlines():
 			line = line.strip()
 			if line and not line.startswith("#"):
-				parts = [part.strip() for part in line.split(",")]
-				if len(parts) >= 4:
-					date = parts[0]  # YYYY-MM-DD format
-
-					# Parse date to check if it's in the past
-					try:
-						date_parts = date.split("-")
-						if len(date_parts) == 3:
-							event_year = int(date_parts[0])
-							event_month = int(date_parts[1])
-							event_day = int(date_parts[2])
-
-							# Skip if event is in the past
-							if (event_year < today_year or
-								(event_year == today_year and event_month < today_month) or
-								(event_year == today_year and event_month == today_month and event_day < today_day)):
-								skipped_count += 1
-								log_verbose(f"Skipping past event: {date} - {parts[1]} {parts[2]}")
-								continue
-
-							# Convert YYYY-MM-DD to MMDD and extract event data
-							date_key = normalize_date_key(f"{date_parts[1]}-{date_parts[2]}")
-							event_data = parse_event_data(parts)
-							events.setdefault(date_key, []).append(event_data)
-
-					except (ValueError, IndexError):
-						log_warning(f"Invalid date format in events: {date}")
-						continue
+				# Only the date column is needed to reject past events, so check
+				# it before tokenizing the rest of the row
+				date = line.split(",", 1)[0].strip()  # YYYY-MM-DD format
+
+				# Parse date to check if it's in the past
+				try:
+					date_parts = date.split("-")
+					if len(date_parts) == 3:
+						event_year = int(date_parts[0])
+						event_month = int(date_parts[1])
+						event_day = int(date_parts[2])
+
+						# Skip if event is in the past
+						if (event_year < today_year or
+							(event_year == today_year and event_month < today_month) or
+							(event_year == today_year and event_month == today_month and event_day < today_day)):
+							skipped_count += 1
+							log_verbose(f"Skipping past event: {date}")
+							continue
+
+						parts = [part.strip() for part in line.split(",")]
+						if len(parts) < 4:
+							continue
+
+						# Convert YYYY-MM-DD to MMDD and extract event data
+						date_key = normalize_date_key(f"{date_parts[1]}-{date_parts[2]}")
+						event_data = parse_event_data(parts)
+						events.setdefault(date_key, []).append(event_data)
+
+				except (ValueError, IndexError):
+					log_warning(f"Invalid date format in events: {date}")
+					continue
 
 		if skipped_count > 0:
 			log_debug(f"Parsed {len(events)} event dates ({skipped_count} past events skipped)")
@@ -2301,31 +2469,38 @@ def parse_events_csv_content(csv_content, rtc):
 	
 def parse_schedule_data(parts):
 	"""Extract schedule fields from CSV parts. Returns (name, schedule_dict)."""
-	name = parts[0]
+	name = intern_str(parts[0])
+	start_hour = int(parts[3])
+	start_min = int(parts[4])
+	end_hour = int(parts[5])
+	end_min = int(parts[6])
 	schedule = {
 		"enabled": parts[1] == "1",
-		"days": [int(d) for d in parts[2] if d.isdigit()],
-		"start_hour": int(parts[3]),
-		"start_min": int(parts[4]),
-		"end_hour": int(parts[5]),
-		"end_min": int(parts[6]),
-		"image": parts[7],
+		"days": frozenset(int(d) for d in parts[2] if d.isdigit()),
+		"start_hour": start_hour,
+		"start_min": start_min,
+		"end_hour": end_hour,
+		"end_min": end_min,
+		# Window bounds in minutes since midnight, computed once here
+		"start_mins": start_hour * 60 + start_min,
+		"end_mins": end_hour * 60 + end_min,
+		"image": intern_str(parts[7]),
 		"progressbar": parts[8] == "1" if len(parts) > 8 else True
 	}
 	return name, schedule
 
-def parse_schedule_csv_content(csv_content, rtc):
+def parse_schedule_csv_content(csv_content, rtc, skip_header=True):
 	"""Parse schedule CSV content directly from string (no file I/O)"""
 	schedules = {}
 
 	try:
-		lines = csv_content.strip().split('\n')
+		lines = csv_content.strip().splitlines()
 
 		if not lines:
 			return schedules
 
-		# Skip header row
-		for line in lines[1:]:
+		# Skip header row (GitHub schedule files start with a column header)
+		for line in (lines[1:] if skip_header else lines):
 			line = line.strip()
 			if not line or line.startswith('#'):
 				continue
@@ -2343,6 +2518,9 @@ def parse_schedule_csv_content(csv_content, rtc):
 		log_error(f"Error parsing schedule CSV: {e}")
 		return {}
 
+# Parsed stocks.csv row (tuple layout, attribute access)
+Stock = namedtuple("Stock", ("symbol", "name", "type", "display_name", "highlight"))
+
 def parse_stocks_csv_content(csv_content):
 	"""Parse stock/forex/crypto/commodity CSV content directly from string.
 
@@ -2364,7 +2542,7 @@ def parse_stocks_csv_content(csv_content):
 	stocks = []
 
 	try:
-		lines = csv_content.strip().split('\n')
+		lines = csv_content.splitlines()
 
 		if not lines:
 			return stocks
@@ -2378,27 +2556,21 @@ def parse_stocks_csv_content(csv_content):
 			parts = [p.strip() for p in line.split(',')]
 
 			if len(parts) >= 2:
-				symbol = parts[0].upper()  # Ticker symbols always uppercase
-				name = parts[1]
+				symbol = intern_str(parts[0].upper())  # Ticker symbols always uppercase
+				name = intern_str(parts[1])
 
 				# Parse optional type field (default: "stock")
-				item_type = parts[2].lower() if len(parts) >= 3 and parts[2] else "stock"
+				item_type = intern_str(parts[2].lower()) if len(parts) >= 3 and parts[2] else "stock"
 
 				# Parse optional display_name field (default: symbol)
-				display_name = parts[3].upper() if len(parts) >= 4 and parts[3] else symbol
+				display_name = intern_str(parts[3].upper()) if len(parts) >= 4 and parts[3] else symbol
 
 				# Parse optional highlight field (default: False/0)
 				highlight = False
 				if len(parts) >= 5 and parts[4]:
 					highlight = (parts[4] == '1' or parts[4].lower() == 'true')
 
-				stocks.append({
-					"symbol": symbol,
-					"name": name,
-					"type": item_type,
-					"display_name": display_name,
-					"highlight": highlight
-				})
+				stocks.append(Stock(symbol, name, item_type, display_name, highlight))
 				highlight_str = " [CHART]" if highlight else ""
 				log_verbose(f"Parsed {item_type}: {symbol} ({name}) -> display as '{display_name}'{highlight_str}")
 
@@ -2409,20 +2581,102 @@ def parse_stocks_csv_content(csv_content):
 		log_error(f"Error parsing stocks CSV: {e}")
 		return []
 
-def fetch_github_events(session, cache_buster, rtc):
+# Conditional GET caches for GitHub raw files and current weather (url -> ETag / Last-Modified / parsed body)
+_etag_cache = {}
+_last_modified_cache = {}
+_body_cache = {}
+
+def _conditional_get_headers(url):
+	"""Build If-None-Match / If-Modified-Since headers for a URL we already hold a parsed copy of"""
+	if url not in _body_cache:
+		return None
+
+	headers = {}
+	etag = _etag_cache.get(url)
+	if etag:
+		headers["If-None-Match"] = etag
+	last_modified = _last_modified_cache.get(url)
+	if last_modified:
+		headers["If-Modified-Since"] = last_modified
+	return headers or None
+
+def _remember_etag(url, response, parsed):
+	"""Store the validators and parsed body of a 200 response for later 304s"""
+	etag = response.headers.get("etag")
+	last_modified = response.headers.get("last-modified")
+	if etag:
+		_etag_cache[url] = etag
+	if last_modified:
+		_last_modified_cache[url] = last_modified
+	if etag or last_modified:
+		_body_cache[url] = parsed
+
+def _forget_etag(url):
+	"""Drop the validators and parsed body held for url"""
+	_etag_cache.pop(url, None)
+	_last_modified_cache.pop(url, None)
+	_body_cache.pop(url, None)
+
+# Date-specific schedule URL currently held in the conditional GET caches (one per day)
+_dated_schedule_url = None
+
+def _read_capped_text(response, max_bytes=API.GITHUB_MAX_BYTES):
+	"""Read a response body in chunks, aborting once it exceeds max_bytes. Returns str or None."""
+	content_length = response.headers.get("content-length")
+	if content_length and int(content_length) > max_bytes:
+		log_warning(f"Response too large ({content_length} bytes), skipping")
+		return None
+
+	body = bytearray()
+	for chunk in response.iter_content(chunk_size=API.GITHUB_CHUNK_SIZE):
+		body.extend(chunk)
+		if len(body) > max_bytes:
+			log_warning(f"Response exceeded {max_bytes} bytes, skipping")
+			return None
+
+	return str(body, "utf-8")
+
+def _iter_response_lines(response, max_bytes=API.GITHUB_MAX_BYTES):
+	"""Yield decoded lines from a response body without materializing it. Raises ValueError past max_bytes."""
+	content_length = response.headers.get("content-length")
+	if content_length and int(content_length) > max_bytes:
+		raise ValueError(f"Response too large ({content_length} bytes)")
+
+	received = 0
+	pending = b""
+	for chunk in response.iter_content(chunk_size=API.GITHUB_CHUNK_SIZE):
+		received += len(chunk)
+		if received > max_bytes:
+			raise ValueError(f"Response exceeded {max_bytes} bytes")
+
+		lines = (pending + chunk).split(b"\n")
+		pending = lines.pop()
+		for line in lines:
+			yield str(line, "utf-8").rstrip("\r")
+
+	if pending:
+		yield str(pending, "utf-8").rstrip("\r")
+
+def fetch_github_events(session, rtc):
 	"""Fetch events from GitHub. Returns events dict."""
-	events_url = f"{Strings.GITHUB_REPO_URL}?t={cache_buster}"
+	events_url = Strings.GITHUB_REPO_URL
 	events = {}
 	response = None
 
 	try:
 		log_verbose(f"Fetching: {events_url}")
-		response = session.get(events_url, timeout=10)
+		response = session.get(events_url, headers=_conditional_get_headers(events_url), timeout=10)
 
 		try:
-			if response.status_code == 200:
-				events = parse_events_csv_content(response.text, rtc)
-				log_verbose(f"Events fetched: {len(events)} event dates")
+			if response.status_code == 304:
+				events = _body_cache[events_url]
+				log_verbose(f"Events unchanged: {len(events)} event dates")
+			elif response.status_code == 200:
+				content = _read_capped_text(response)
+				if content is not None:
+					events = parse_events_csv_content(content, rtc)
+					_remember_etag(events_url, response, events)
+					log_verbose(f"Events fetched: {len(events)} event dates")
 			else:
 				log_warning(f"Failed to fetch events: HTTP {response.status_code}")
 		finally:
@@ -2437,24 +2691,40 @@ def fetch_github_events(session, cache_buster, rtc):
 
 	return events
 
-def fetch_github_schedules(session, github_base, cache_buster, rtc, date_str):
+def fetch_github_schedules(session, github_base, rtc, date_str):
 	"""Fetch schedules from GitHub (date-specific or default). Returns (schedules, schedule_source)."""
+	global _dated_schedule_url
 	schedules = {}
 	schedule_source = None
 	response = None
 
 	try:
 		# Try date-specific schedule first
-		schedule_url = f"{github_base}/{Paths.GITHUB_SCHEDULE_FOLDER}/{date_str}.csv?t={cache_buster}"
+		schedule_url = f"{github_base}/{Paths.GITHUB_SCHEDULE_FOLDER}/{date_str}.csv"
 		log_verbose(f"Fetching: {schedule_url}")
 
-		response = session.get(schedule_url, timeout=10)
+		# The URL changes every day - evict the previous day's entry so the
+		# caches hold at most one date-specific schedule
+		if _dated_schedule_url != schedule_url:
+			if _dated_schedule_url is not None:
+				_forget_etag(_dated_schedule_url)
+			_dated_schedule_url = schedule_url
+
+		response = session.get(schedule_url, headers=_conditional_get_headers(schedule_url), timeout=10)
 
 		try:
-			if response.status_code == 200:
-				schedules = parse_schedule_csv_content(response.text, rtc)
+			if response.status_code == 304:
+				schedules = _body_cache[schedule_url]
 				schedule_source = "date-specific"
-				log_verbose(f"Schedule fetched: {date_str}.csv ({len(schedules)} schedule(s))")
+				log_verbose(f"Schedule unchanged: {date_str}.csv ({len(schedules)} schedule(s))")
+
+			elif response.status_code == 200:
+				content = _read_capped_text(response)
+				if content is not None:
+					schedules = parse_schedule_csv_content(content, rtc)
+					_remember_etag(schedule_url, response, schedules)
+					schedule_source = "date-specific"
+					log_verbose(f"Schedule fetched: {date_str}.csv ({len(schedules)} schedule(s))")
 
 			elif response.status_code == 404:
 				# No date-specific file, try default
@@ -2466,14 +2736,21 @@ def fetch_github_schedules(session, github_base, cache_buster, rtc, date_str):
 				except:
 					pass
 
-				default_url = f"{github_base}/{Paths.GITHUB_SCHEDULE_FOLDER}/default.csv?t={cache_buster}"
-				response = session.get(default_url, timeout=10)
+				default_url = f"{github_base}/{Paths.GITHUB_SCHEDULE_FOLDER}/default.csv"
+				response = session.get(default_url, headers=_conditional_get_headers(default_url), timeout=10)
 
 				try:
-					if response.status_code == 200:
-						schedules = parse_schedule_csv_content(response.text, rtc)
+					if response.status_code == 304:
+						schedules = _body_cache[default_url]
 						schedule_source = "default"
-						log_verbose(f"Schedule fetched: default.csv ({len(schedules)} schedule(s))")
+						log_verbose(f"Schedule unchanged: default.csv ({len(schedules)} schedule(s))")
+					elif response.status_code == 200:
+						content = _read_capped_text(response)
+						if content is not None:
+							schedules = parse_schedule_csv_content(content, rtc)
+							_remember_etag(default_url, response, schedules)
+							schedule_source = "default"
+							log_verbose(f"Schedule fetched: default.csv ({len(schedules)} schedule(s))")
 					else:
 						log_warning(f"No default schedule found: HTTP {response.status_code}")
 				finally:
@@ -2499,7 +2776,7 @@ def fetch_github_schedules(session, github_base, cache_buster, rtc, date_str):
 
 	return schedules, schedule_source
 
-def fetch_stocks_from_github(session, cache_buster):
+def fetch_stocks_from_github(session):
 	"""Fetch stock symbols from GitHub. Returns stocks list."""
 	if not Strings.STOCKS_CSV_URL:
 		log_verbose("No STOCKS_CSV_URL configured")
@@ -2507,11 +2784,11 @@ def fetch_stocks_from_github(session, cache_buster):
 
 	stocks = []
 	response = None
-	stocks_url = f"{Strings.STOCKS_CSV_URL}?t={cache_buster}"
+	stocks_url = Strings.STOCKS_CSV_URL
 
 	try:
 		log_verbose(f"Fetching: {stocks_url}")
-		response = session.get(stocks_url, timeout=10)
+		response = session.get(stocks_url, headers=_conditional_get_headers(stocks_url), timeout=10)
 
 		# Check if response is valid before accessing attributes
 		if not response:
@@ -2519,10 +2796,16 @@ def fetch_stocks_from_github(session, cache_buster):
 			return stocks
 
 		try:
-			if response.status_code == 200:
+			if response.status_code == 304:
+				stocks = _body_cache[stocks_url]
+				log_verbose(f"Stocks unchanged: {len(stocks)} symbols")
+			elif response.status_code == 200:
 				# Parse CSV content using helper function
-				stocks = parse_stocks_csv_content(response.text)
-				log_verbose(f"Stocks fetched: {len(stocks)} symbols")
+				content = _read_capped_text(response)
+				if content is not None:
+					stocks = parse_stocks_csv_content(content)
+					_remember_etag(stocks_url, response, stocks)
+					log_verbose(f"Stocks fetched: {len(stocks)} symbols")
 			else:
 				log_warning(f"Failed to fetch stocks: HTTP {response.status_code}")
 		finally:
@@ -2543,7 +2826,7 @@ def fetch_stock_prices(symbols_to_fetch):
 	Fetches up to 3 symbols in a single batch request.
 
 	Args:
-		symbols_to_fetch: List of stock symbol dicts [{"symbol": "AAPL", "name": "Apple"}, ...]
+		symbols_to_fetch: List of Stock tuples [Stock("AAPL", "Apple", ...), ...]
 
 	Returns:
 		dict: {symbol: {"price": float, "change_percent": float, "direction": str}}
@@ -2568,7 +2851,7 @@ def fetch_stock_prices(symbols_to_fetch):
 
 	try:
 		# Build comma-separated symbol list (typically 3 symbols)
-		symbols_list = [s["symbol"] for s in symbols_to_fetch]
+		symbols_list = [s.symbol for s in symbols_to_fetch]
 		symbols_str = ",".join(symbols_list)
 
 		# Twelve Data Quote API endpoint (batch)
@@ -2583,8 +2866,8 @@ def fetch_stock_prices(symbols_to_fetch):
 			return stock_data
 
 		if response.status_code == 200:
-			import json
-			data = json.loads(response.text)
+			# Parse straight from the socket stream (no response.text decode)
+			data = response.json()
 
 			# Handle Twelve Data response formats:
 			# Single symbol: {"symbol": "AAPL", "name": ..., "close": ..., "percent_change": ...}
@@ -2604,7 +2887,7 @@ def fetch_stock_prices(symbols_to_fetch):
 
 			for quote in quotes:
 				# Check if quote has error
-				if "status" in quote and quote["status"] == "error":
+				if quote.get("status") == "error":
 					log_warning(f"Error fetching {quote.get('symbol', 'unknown')}: {quote.get('message', 'unknown error')}")
 					continue
 
@@ -2670,19 +2953,22 @@ def fetch_intraday_time_series(symbol, interval="15min", outputsize=26):
 		outputsize: Number of data points to fetch (default 26 for ~6.5 hours with 15min interval)
 
 	Returns:
-		List of dicts: [{datetime, open_price, close_price}, ...] ordered chronologically (oldest first)
-		Returns empty list on error
+		Dict of columns ordered chronologically (oldest first):
+		{"datetime": [str, ...], "close_price": array('f'), "session_open": float, "session_date": str}
+		session_open is the open of the first bar dated session_date, the newest
+		bar's date (YYYY-MM-DD); 0.0 if it can't be parsed
+		Returns None on error
 	"""
 	# Get API key
 	api_key = os.getenv(Strings.TWELVE_DATA_API_KEY)
 	if not api_key:
 		log_warning("TWELVE_DATA_API_KEY not configured in settings.toml")
-		return []
+		return None
 
 	session = get_requests_session()
 	if not session:
 		log_warning("No session available for intraday fetch")
-		return []
+		return None
 
 	response = None
 
@@ -2698,52 +2984,92 @@ def fetch_intraday_time_series(symbol, interval="15min", outputsize=26):
 
 		if not response:
 			log_warning("No response from server")
-			return []
+			return None
 
 		if response.status_code == 200:
-			import json
-			data = json.loads(response.text)
+			# Parse straight from the socket stream (skips building response.text)
+			data = response.json()
 
 			# Check for errors
-			if "status" in data and data["status"] == "error":
+			if data.get("status") == "error":
 				log_warning("API error for " + symbol + ": " + data.get("message", "unknown"))
-				return []
+				return None
 
 			# Extract values array
-			if "values" not in data:
+			values = data.get("values")
+			if values is None:
 				log_warning("No values in time series response")
-				return []
+				return None
 
-			values = data["values"]
-			if not values or len(values) == 0:
+			if not values:
 				log_warning("Empty values array in time series")
-				return []
+				return None
 
 			# Parse data points (API returns newest first, we want oldest first)
-			time_series = []
-			for point in reversed(values):
+			# Popping from the end yields oldest first and frees each source dict
+			# as soon as it is converted, so the raw and parsed series never
+			# coexist in full
+			# Columns are stored as parallel float32 arrays instead of a dict per point
+			del data
+
+			# Only the session open is ever used: the open of the first bar dated
+			# the same day as the newest bar (values are newest first). Convert
+			# just that one rather than parsing an open column per point
+			session_date = values[0].get("datetime", "")[:10]
+			session_start = 0
+			for i in range(1, len(values)):
+				if not values[i].get("datetime", "").startswith(session_date):
+					break
+				session_start = i
+			try:
+				session_open = float(values[session_start].get("open", 0))
+			except (ValueError, TypeError):
+				session_open = 0.0
+
+			# Preallocate both columns (zeroed float32 array from raw bytes) and
+			# fill by index, trimming afterwards if any points were skipped
+			total_points = len(values)
+			datetimes = [None] * total_points
+			close_prices = array.array("f", bytearray(4 * total_points))
+
+			# Bind the bound method once so the loop body avoids attribute lookups
+			# (each point keeps its own guard so one malformed bar is skipped
+			# instead of dropping the whole series)
+			pop_point = values.pop
+			count = 0
+			while values:
+				point = pop_point()
 				try:
-					time_series.append({
-						"datetime": point.get("datetime", ""),
-						"open_price": float(point.get("open", 0)),
-						"close_price": float(point.get("close", 0))
-					})
+					close_prices[count] = float(point.get("close", 0))
 				except (ValueError, TypeError) as e:
 					log_verbose("Skipping invalid data point: " + str(e))
 					continue
-
-			num_points = len(time_series)
+				datetimes[count] = point.get("datetime", "")
+				count += 1
+
+			if count < total_points:
+				datetimes = datetimes[:count]
+				close_prices = close_prices[:count]
+
+			time_series = {
+				"datetime": datetimes,
+				"close_price": close_prices,
+				"session_open": session_open,
+				"session_date": session_date
+			}
+			num_points = len(close_prices)
 			# Track API usage: 1 credit for time_series call
 			state.tracker.record_api_success("stock", 1)
-			log_verbose("Received " + str(num_points) + " data points for " + symbol + " (Stock API: +" + str(1) + ", Total: " + str(state.tracker.stock_api_calls) + "/800)")
+			if VERBOSE_ENABLED:
+				log_verbose("Received %d data points for %s (Stock API: +1, Total: %d/800)" % (num_points, symbol, state.tracker.stock_api_calls))
 			return time_series
 		else:
 			log_warning("HTTP " + str(response.status_code) + " for intraday fetch")
-			return []
+			return None
 
 	except Exception as e:
 		log_warning("Failed to fetch intraday data: " + str(e))
-		return []
+		return None
 
 	finally:
 		# CRITICAL: Close response to release socket
@@ -2753,13 +3079,60 @@ def fetch_intraday_time_series(symbol, interval="15min", outputsize=26):
 			except:
 				pass
 
-	return []
+	return None
+
+def _parse_train_prediction(pred, cur_mins, train_routes):
+	"""Convert one CTA train prediction into an arrival dict, or None if it's filtered out"""
+	route = pred.get("rt", "??")
+	destination = pred.get("destNm", "Unknown")
+
+	# Filter: Red line from Fullerton, Brown/Purple to Loop from Diversey
+	route_info = train_routes.get(route)
+	if route_info is None:
+		return None
+	route_abbrev, min_minutes, loop_only = route_info
+	if loop_only and "Loop" not in destination:
+		return None
+
+	# Calculate minutes until arrival ("DUE" or unparseable times never pass the minimum below)
+	arr_time_str = pred.get("arrT", "")
+	if cur_mins is None or len(arr_time_str) < 16:
+		return None
+	try:
+		diff_mins = int(arr_time_str[11:13]) * 60 + int(arr_time_str[14:16]) - cur_mins
+	except ValueError:
+		return None
+	if diff_mins < 0:
+		diff_mins += 24 * 60
+
+	# Apply minimum time filters: Red (Fullerton) >= 14 min, Brown/Purple (Diversey) >= 10 min
+	if diff_mins < min_minutes:
+		return None
+
+	return {"route": route_abbrev, "destination": destination, "minutes": str(diff_mins)}
+
+def _parse_bus_prediction(pred):
+	"""Convert one CTA bus prediction into an arrival dict"""
+	minutes = pred.get("prdctdn", "?")
+
+	# Convert "DUE" to 0 for consistency
+	if minutes == "DUE":
+		minutes = "0"
+
+	return {"route": "8", "destination": pred.get("des", "South"), "minutes": minutes}
 
 def fetch_transit_arrivals():
 	"""
 	Fetch CTA train and bus arrival predictions.
+	Both train stations are batched into one mapid request, so a refresh is two
+	sequential calls (train, bus); CircuitPython has no threads to overlap them.
 	Returns list of arrival predictions: [{"route": str, "destination": str, "minutes": str}, ...]
 	"""
+	# Predictions barely move within the TTL, so skip the round trips entirely
+	if state.cached_transit_arrivals and time.monotonic() - state.last_transit_fetch_time < CTAAPI.ARRIVAL_TTL_SECONDS:
+		log_verbose("Using cached transit arrivals")
+		return state.cached_transit_arrivals
+
 	session = get_requests_session()
 	if not session:
 		log_warning("No session for transit fetch")
@@ -2772,7 +3145,6 @@ def fetch_transit_arrivals():
 	bus_stop_id = os.getenv(Strings.CTA_STOP_ID)
 
 	arrivals = []
-	import json
 
 	# Fetch train arrivals (Fullerton + Diversey in single API call)
 	if train_api_key and (fullerton_id or diversey_id):
@@ -2786,64 +3158,32 @@ def fetch_transit_arrivals():
 		response = None
 		try:
 			url = f"{CTAAPI.TRAIN_BASE_URL}/{CTAAPI.TRAIN_ARRIVALS_ENDPOINT}?key={train_api_key}&mapid={mapid_param}&outputType=JSON"
-			log_verbose(f"Fetching train arrivals for stations: {mapid_param}")
+			if VERBOSE_ENABLED:
+				log_verbose(f"Fetching train arrivals for stations: {mapid_param}")
 			response = session.get(url, timeout=CTAAPI.TIMEOUT)
 
 			if response and response.status_code == 200:
-				data = json.loads(response.text)
+				data = response.json()
 				if "ctatt" in data:
 					ctatt = data["ctatt"]
 					if ctatt.get("errCd") == "0":
 						predictions = ctatt.get("eta", [])
-						log_debug(f"Fetched {len(predictions)} train predictions")
-
-						for pred in predictions:
-							route = pred.get("rt", "??")
-							destination = pred.get("destNm", "Unknown")
-
-							# Filter: Red line from Fullerton, Brown/Purple to Loop from Diversey
-							route_abbrev = None
-							if route == "Red":
-								route_abbrev = "red"
-							elif route == "Brn" and "Loop" in destination:
-								route_abbrev = "brn"
-							elif route == "P" and "Loop" in destination:
-								route_abbrev = "ppl"
-							else:
-								continue  # Skip this prediction
-
-							# Calculate minutes until arrival
-							arr_time_str = pred.get("arrT", "")
-							tmst = ctatt.get("tmst", "")
-
-							try:
-								if 'T' in arr_time_str and 'T' in tmst:
-									arr_time_part = arr_time_str.split('T')[1]
-									cur_time_part = tmst.split('T')[1]
-									arr_hms = arr_time_part.split(':')
-									cur_hms = cur_time_part.split(':')
-									total_arr_mins = int(arr_hms[0]) * 60 + int(arr_hms[1])
-									total_cur_mins = int(cur_hms[0]) * 60 + int(cur_hms[1])
-									diff_mins = total_arr_mins - total_cur_mins
-									if diff_mins < 0:
-										diff_mins += 24 * 60
-									minutes = str(diff_mins)
-								else:
-									raise ValueError("Invalid time format")
-							except Exception:
-								minutes = "DUE" if pred.get("isApp") == "1" else "?"
-
-							# Apply minimum time filters: Red (Fullerton) >= 14 min, Brown/Purple (Diversey) >= 10 min
-							try:
-								mins_int = int(minutes)
-								if route == "Red" and mins_int < 14:
-									continue
-								elif route in ["Brn", "P"] and mins_int < 10:
-									continue
-							except ValueError:
-								continue  # Skip "DUE" or "?"
-
-							arrivals.append({"route": route_abbrev, "destination": destination, "minutes": minutes})
+						if DEBUG_ENABLED:
+							log_debug(f"Fetched {len(predictions)} train predictions")
+						train_routes = CTAAPI.TRAIN_ROUTES
+
+						# Timestamps are fixed-width ISO ("YYYY-MM-DDTHH:MM:SS"), so HH and MM
+						# are sliced directly; the current time is parsed once per response
+						tmst = ctatt.get("tmst", "")
+						try:
+							cur_mins = int(tmst[11:13]) * 60 + int(tmst[14:16])
+						except ValueError:
+							cur_mins = None
+
+						arrivals.extend([
+							arrival for arrival in (_parse_train_prediction(pred, cur_mins, train_routes) for pred in predictions)
+							if arrival is not None
+						])
 					else:
 						log_warning(f"CTA Train API error: {ctatt.get('errNm', 'Unknown error')}")
 		except Exception as e:
@@ -2860,27 +3200,20 @@ def fetch_transit_arrivals():
 		response = None
 		try:
 			url = f"{CTAAPI.BUS_BASE_URL}/{CTAAPI.BUS_PREDICTIONS_ENDPOINT}?key={bus_api_key}&stpid={bus_stop_id}&rt=8&format=json"
-			log_verbose(f"Fetching bus predictions for stop {bus_stop_id}")
+			if VERBOSE_ENABLED:
+				log_verbose(f"Fetching bus predictions for stop {bus_stop_id}")
 			response = session.get(url, timeout=CTAAPI.TIMEOUT)
 
 			if response and response.status_code == 200:
-				data = json.loads(response.text)
+				data = response.json()
 				if "bustime-response" in data:
 					bus_response = data["bustime-response"]
 					if "prd" in bus_response:
 						predictions = bus_response["prd"]
-						log_debug(f"Fetched {len(predictions)} bus predictions")
+						if DEBUG_ENABLED:
+							log_debug(f"Fetched {len(predictions)} bus predictions")
 
-						for pred in predictions:
-							route = pred.get("rt", "8")
-							destination = pred.get("des", "South")
-							minutes = pred.get("prdctdn", "?")
-
-							# Convert "DUE" to 0 for consistency
-							if minutes == "DUE":
-								minutes = "0"
-
-							arrivals.append({"route": "8", "destination": destination, "minutes": minutes})
+						arrivals.extend([_parse_bus_prediction(pred) for pred in predictions])
 					elif "error" in bus_response:
 						errors = bus_response["error"]
 						for err in errors:
@@ -2894,6 +3227,10 @@ def fetch_transit_arrivals():
 				except:
 					pass
 
+	if arrivals:
+		state.cached_transit_arrivals = arrivals
+		state.last_transit_fetch_time = time.monotonic()
+
 	return arrivals
 
 def fetch_github_data(rtc):
@@ -2913,111 +3250,127 @@ def fetch_github_data(rtc):
 		log_warning("GITHUB_REPO_URL not configured")
 		return None, None, None, None
 
-	cache_buster = int(time.monotonic())
 	github_base = Strings.GITHUB_REPO_URL.rsplit('/', 1)[0] if Strings.GITHUB_REPO_URL else None
 
 	# Fetch events, schedules, and stocks
-	events = fetch_github_events(session, cache_buster, rtc)
+	# Sequential by design: CircuitPython has no threads and adafruit_requests
+	# blocks, so the fetches cannot overlap. They share one keep-alive session
+	# and unchanged files come back as bodiless 304s.
+	events = fetch_github_events(session, rtc)
 
-	now = rtc.datetime
-	date_str = f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
-	schedules, schedule_source = fetch_github_schedules(session, github_base, cache_buster, rtc, date_str)
+	date_str = format_date_str(rtc.datetime)
+	schedules, schedule_source = fetch_github_schedules(session, github_base, rtc, date_str)
 
-	stocks = fetch_stocks_from_github(session, cache_buster)
+	stocks = fetch_stocks_from_github(session)
 
 	return events, schedules, schedule_source, stocks
 	
+# Parsed local CSV cache: path -> ((path, mtime), result)
+# Kept in RAM: CIRCUITPY is read-only to code.py unless boot.py remounts it,
+# so parsed copies cannot be persisted back to flash
+_csv_cache = {}
+
+def _cached_csv(path, parser):
+	"""Return parser(path), reusing the last result while the file's mtime is unchanged"""
+	try:
+		key = (path, os.stat(path)[8])
+	except OSError:
+		return parser(path)
+
+	cached = _csv_cache.get(path)
+	if cached and cached[0] == key:
+		log_verbose(f"Using cached {path}")
+		return cached[1]
+
+	result = parser(path)
+	if result:
+		_csv_cache[path] = (key, result)
+	return result
+
 def load_schedules_from_csv():
-	"""Load schedules from CSV file"""
-	schedules = {}
+	"""Load schedules from CSV file (cached until the file changes)"""
+	return _cached_csv(Paths.SCHEDULES_CSV, _read_schedules_csv)
+
+def load_stocks_from_csv():
+	"""Load stock symbols from CSV file (cached until the file changes)"""
+	return _cached_csv(Paths.STOCKS_CSV, _read_stocks_csv)
+
+def _read_schedules_csv(path):
+	"""Read the local schedules CSV and parse it with the shared schedule parser"""
 	try:
-		log_verbose("Loading schedules from schedules.csv...")
-		with open("schedules.csv", "r") as f:
-			for line in f:
-				line = line.strip()
-				if line and not line.startswith("#"):
-					parts = [part.strip() for part in line.split(",")]
-					if len(parts) >= 8:
-						name, schedule = parse_schedule_data(parts)
-						schedules[name] = schedule
+		log_verbose(f"Loading schedules from {path}...")
+		with open(path, "r") as f:
+			schedules = parse_schedule_csv_content(f.read(), None, skip_header=False)
 
 		# Log successful load
 		if schedules:
 			log_debug(f"{len(schedules)} schedules loaded")
 		else:
-			log_warning("No schedules found in schedules.csv")
+			log_warning(f"No schedules found in {path}")
 
 		return schedules
 
 	except Exception as e:
-		log_warning(f"Failed to load schedules.csv: {e}")
+		log_warning(f"Failed to load {path}: {e}")
 		return {}
 
-def load_stocks_from_csv():
-	"""Load stock symbols from CSV file"""
-	stocks = []
+def _read_stocks_csv(path):
+	"""Read the local stocks CSV and parse it with the shared stocks parser"""
 	try:
-		log_verbose("Loading stocks from stocks.csv...")
-		with open("stocks.csv", "r") as f:
-			for line in f:
-				line = line.strip()
-				if line and not line.startswith("#"):
-					parts = [part.strip() for part in line.split(",")]
-					if len(parts) >= 2:
-						symbol = parts[0].upper()  # Ticker symbols always uppercase
-						name = parts[1]
-						stocks.append({"symbol": symbol, "name": name})
+		log_verbose(f"Loading stocks from {path}...")
+		with open(path, "r") as f:
+			stocks = parse_stocks_csv_content(f.read())
 
 		# Log successful load
 		if stocks:
 			log_debug(f"{len(stocks)} stock symbols loaded")
 		else:
-			log_warning("No stocks found in stocks.csv")
+			log_warning(f"No stocks found in {path}")
 
 		return stocks
 
 	except Exception as e:
-		log_warning(f"Failed to load stocks.csv: {e}")
+		log_warning(f"Failed to load {path}: {e}")
 		return []
 
 # ============================================================================
 # Display Configuration Loading
 # ============================================================================
 
+# Boolean config values (1 = True, 0 = False)
+_CONFIG_BOOLEANS = {'0': False, '1': True}
+
 def parse_display_config_csv(csv_content):
 	"""Parse display config CSV content. Returns dict of settings."""
+	return _parse_display_config_lines(csv_content.splitlines())
+
+def _parse_display_config_lines(lines):
+	"""Parse display config from any iterable of lines. Returns dict of settings."""
 	config = {}
 
 	try:
-		lines = csv_content.strip().split('\n')
-
-		if not lines:
-			return config
-
 		# Parse key-value pairs
 		for line in lines:
-			line = line.strip()
-			if not line or line.startswith('#'):
+			key, sep, rest = line.partition(',')
+			key = key.strip()
+			if not sep or not key or key.startswith('#'):
 				continue
 
-			parts = [p.strip() for p in line.split(',')]
+			value = rest.partition(',')[0].strip()
 
-			if len(parts) >= 2:
-				key = parts[0]
-				value = parts[1]
-
-				# Convert to appropriate type
-				if value in ('0', '1'):
-					# Boolean values
-					config[key] = (value == '1')
-				elif value.isdigit():
+			# Convert to appropriate type
+			parsed = _CONFIG_BOOLEANS.get(value)
+			if parsed is None:
+				if value.isdigit():
 					# Numeric values (e.g., stocks_display_frequency=3)
-					config[key] = int(value)
+					parsed = int(value)
 				else:
 					# String values
-					config[key] = value
+					parsed = value
+			config[key] = parsed
 
-				log_verbose(f"Config: {key} = {config[key]}")
+			if VERBOSE_ENABLED:
+				log_verbose(f"Config: {key} = {parsed}")
 
 		log_debug(f"Parsed {len(config)} config settings")
 		return config
@@ -3047,33 +3400,32 @@ def fetch_display_config_from_github():
 	# Determine which config to fetch based on matrix type
 	matrix_type = detect_matrix_type()
 
-	# Get URL from settings (fallback to None if not set)
-	if matrix_type == "type1":
-		config_url = os.getenv("MATRIX1_CONFIG_URL")
-	elif matrix_type == "type2":
-		config_url = os.getenv("MATRIX2_CONFIG_URL")
-	else:
+	# URLs are read from settings once at import (None if not set)
+	if matrix_type not in Strings.MATRIX_CONFIG_URLS:
 		log_warning(f"Unknown matrix type: {matrix_type}")
 		return {}
 
+	config_url = Strings.MATRIX_CONFIG_URLS[matrix_type]
 	if not config_url:
 		log_debug(f"No GitHub config URL set for matrix type {matrix_type}")
 		return {}
 
-	# Add cache buster
-	cache_buster = int(time.monotonic())
-	url = f"{config_url}?t={cache_buster}"
-
+	url = config_url
 	response = None
 	config = {}
 
 	try:
 		log_verbose(f"Fetching config: {url}")
-		response = session.get(url, timeout=10)
+		response = session.get(url, headers=_conditional_get_headers(url), timeout=10)
 
 		try:
-			if response.status_code == 200:
-				config = parse_display_config_csv(response.text)
+			if response.status_code == 304:
+				config = _body_cache[url]
+				log_info(f"GitHub config unchanged for matrix {matrix_type}: {len(config)} settings")
+			elif response.status_code == 200:
+				config = _parse_display_config_lines(_iter_response_lines(response))
+				if config:
+					_remember_etag(url, response, config)
 				log_info(f"GitHub config loaded for matrix {matrix_type}: {len(config)} settings")
 			elif response.status_code == 404:
 				log_debug(f"No GitHub config found for matrix {matrix_type} (404)")
@@ -3092,57 +3444,36 @@ def fetch_display_config_from_github():
 
 	return config
 
+# Settings that remote/local config CSVs are allowed to override
+_ALLOWED_CONFIG_KEYS = frozenset((
+	# Core displays
+	"show_weather",
+	"show_forecast",
+	"show_events",
+	"show_stocks",
+	"stocks_display_frequency",
+	"stocks_respect_market_hours",
+	"show_transit",
+	"transit_respect_commute_hours",
+	# Display elements
+	"show_weekday_indicator",
+	"show_scheduled_displays",
+	"show_events_in_between_schedules",
+	"night_mode_minimal_display",
+	# Safety features
+	"delayed_start",
+))
+
 def apply_display_config(config_dict):
 	"""Apply loaded config settings to display_config"""
 	if not config_dict:
 		return
 
 	applied = 0
-
-	# Core displays
-	if "show_weather" in config_dict:
-		display_config.show_weather = config_dict["show_weather"]
-		applied += 1
-	if "show_forecast" in config_dict:
-		display_config.show_forecast = config_dict["show_forecast"]
-		applied += 1
-	if "show_events" in config_dict:
-		display_config.show_events = config_dict["show_events"]
-		applied += 1
-	if "show_stocks" in config_dict:
-		display_config.show_stocks = config_dict["show_stocks"]
-		applied += 1
-	if "stocks_display_frequency" in config_dict:
-		display_config.stocks_display_frequency = config_dict["stocks_display_frequency"]
-		applied += 1
-	if "stocks_respect_market_hours" in config_dict:
-		display_config.stocks_respect_market_hours = config_dict["stocks_respect_market_hours"]
-		applied += 1
-	if "show_transit" in config_dict:
-		display_config.show_transit = config_dict["show_transit"]
-		applied += 1
-	if "transit_respect_commute_hours" in config_dict:
-		display_config.transit_respect_commute_hours = config_dict["transit_respect_commute_hours"]
-		applied += 1
-
-	# Display elements
-	if "show_weekday_indicator" in config_dict:
-		display_config.show_weekday_indicator = config_dict["show_weekday_indicator"]
-		applied += 1
-	if "show_scheduled_displays" in config_dict:
-		display_config.show_scheduled_displays = config_dict["show_scheduled_displays"]
-		applied += 1
-	if "show_events_in_between_schedules" in config_dict:
-		display_config.show_events_in_between_schedules = config_dict["show_events_in_between_schedules"]
-		applied += 1
-	if "night_mode_minimal_display" in config_dict:
-		display_config.night_mode_minimal_display = config_dict["night_mode_minimal_display"]
-		applied += 1
-
-	# Safety features
-	if "delayed_start" in config_dict:
-		display_config.delayed_start = config_dict["delayed_start"]
-		applied += 1
+	for key, value in config_dict.items():
+		if key in _ALLOWED_CONFIG_KEYS:
+			setattr(display_config, key, value)
+			applied += 1
 
 	log_debug(f"Applied {applied} config settings to display_config")
 
@@ -3154,19 +3485,36 @@ class ScheduledDisplay:
 		self.schedules = {}
 		self.schedules_loaded = False
 		self.last_fetch_date = None
+		self._cached_date = None
+		self._last_date_check = 0
+		self._last_refresh_attempt = None
 	
 	def ensure_loaded(self, rtc):
 		"""Ensure schedules are loaded, refresh if new day"""
 		
-		current_date = f"{rtc.datetime.tm_year:04d}-{rtc.datetime.tm_mon:02d}-{rtc.datetime.tm_mday:02d}"
-		
-		# Check if we need daily refresh
-		if self.last_fetch_date and self.last_fetch_date != current_date:
+		# The date only changes once a day - re-read the RTC at most once a minute
+		now = time.monotonic()
+		if self._cached_date and now - self._last_date_check < System.SECONDS_PER_MINUTE:
+			current_date = self._cached_date
+		else:
+			current_date = format_date_str(rtc.datetime)
+			self._cached_date = current_date
+			self._last_date_check = now
+		
+		# Check if we need daily refresh - after a failed attempt, keep serving
+		# yesterday's schedules and back off instead of blocking every cycle
+		if self.last_fetch_date and self.last_fetch_date != current_date and (
+			self._last_refresh_attempt is None
+			or now - self._last_refresh_attempt >= Timing.SCHEDULE_REFRESH_RETRY
+		):
 			log_info("New day - refreshing GitHub data")
+			self._last_refresh_attempt = now
 			events, schedules, schedule_source, stocks = fetch_github_data(rtc)  # ← Updated
 
 			if schedules:
+				# Single assignment swaps in the new table
 				self.schedules = schedules
+				self._last_refresh_attempt = None
 				self.schedules_loaded = True
 				self.last_fetch_date = current_date
 
@@ -3176,23 +3524,13 @@ class ScheduledDisplay:
 
 				# Update cached stocks too
 				if stocks:
-					state.cached_stocks = stocks
+					set_cached_stocks(stocks)
 				
 				# Summary with counts
 				event_count = len(events) if events else 0
 				source_msg = f" ({schedule_source})" if schedule_source else ""
 				log_debug(f"Refreshed: {event_count} event dates, {len(schedules)} schedules{source_msg}")
 		
-		# Fallback if still not loaded (safety net)
-		if not self.schedules_loaded:
-			log_debug("Schedules not loaded, trying local fallback")
-			local_schedules = load_schedules_from_csv()
-			if local_schedules:
-				self.schedules = local_schedules
-				self.schedules_loaded = True
-				self.last_fetch_date = current_date
-				log_debug(f"Local fallback: {len(local_schedules)} schedules")
-		
 		# Fallback if still not loaded (safety net)
 		if not self.schedules_loaded:
 			log_debug("Schedules not loaded, trying local fallback")
@@ -3226,12 +3564,10 @@ class ScheduledDisplay:
 		if current.tm_wday not in schedule["days"]:
 			return False
 		
-		# Convert times to minutes for easier comparison
+		# Compare against the window precomputed at parse time
 		current_mins = current.tm_hour * 60 + current.tm_min
-		start_mins = schedule["start_hour"] * 60 + schedule["start_min"]
-		end_mins = schedule["end_hour"] * 60 + schedule["end_min"]
 		
-		return start_mins <= current_mins < end_mins
+		return schedule["start_mins"] <= current_mins < schedule["end_mins"]
 	
 	def get_active_schedule(self, rtc):
 		"""Check if any schedule is currently active"""
@@ -3239,8 +3575,14 @@ class ScheduledDisplay:
 		# Ensure schedules are loaded
 		self.ensure_loaded(rtc)
 		
+		# Single pass with one RTC read (same checks as is_active)
+		current = rtc.datetime
+		current_mins = current.tm_hour * 60 + current.tm_min
+		wday = current.tm_wday
+		
 		for schedule_name, schedule_config in self.schedules.items():
-			if self.is_active(rtc, schedule_name):
+			if (schedule_config["enabled"] and wday in schedule_config["days"]
+					and schedule_config["start_mins"] <= current_mins < schedule_config["end_mins"]):
 				return schedule_name, schedule_config
 		
 		return None, None
@@ -3284,11 +3626,35 @@ def calculate_bottom_aligned_positions(font, line1_text, line2_text, display_hei
 	return int(line1_y), int(line2_y)
 
 
+def empty_group(group):
+	"""Detach all children from a displayio.Group"""
+	# displayio.Group has no clear(); pop from the end a fixed number of times
+	pop = group.pop
+	for _ in range(len(group)):
+		pop()
+
 def clear_display():
 	"""Clear all display elements"""
 	if state.main_group is not None:
-		while len(state.main_group):
-			state.main_group.pop()
+		empty_group(state.main_group)
+
+def get_pooled_label(key, label_font, text, color, x, y):
+	"""Return the reusable label for key with its text, color and position updated.
+
+	Labels are created on first use and kept in state.label_pool, so displays
+	that redraw the same slots every cycle stop allocating new Label objects.
+	Each key must appear at most once per screen (a label has one parent).
+	"""
+	label = state.label_pool.get(key)
+	if label is None:
+		label = bitmap_label.Label(label_font, text=text, color=color, x=x, y=y)
+		state.label_pool[key] = label
+	else:
+		label.text = text
+		label.color = color
+		label.x = x
+		label.y = y
+	return label
 
 ### DISPLAY FUNCTIONS ###
 
@@ -3304,6 +3670,14 @@ def get_12h_hour(hour):
 	"""
 	return hour % 12 or 12
 
+# Clock text pieces: 12-hour display hour indexed by 24-hour value, zero-padded minutes
+_CLOCK_HOUR_STR = tuple(str(h % 12 or 12) for h in range(24))
+_TWO_DIGIT_STR = tuple(f"{i:02d}" for i in range(60))
+
+def format_clock_time(hour, minute):
+	"""Format 24-hour time as the 12-hour clock text (e.g., 13, 5 → '1:05')"""
+	return _CLOCK_HOUR_STR[hour] + ":" + _TWO_DIGIT_STR[minute]
+
 def format_hour_12h(hour):
 	"""Convert 24-hour time to 12-hour format with AM/PM suffix (e.g., '3P', '12A')"""
 	h = get_12h_hour(hour)
@@ -3325,32 +3699,29 @@ def get_day_color(rtc):
 	weekday = rtc.datetime.tm_wday  # 0=Monday, 6=Sunday
 	return day_colors.get(weekday, state.colors["WHITE"])  # Default to white if error
 
-def add_day_indicator_bitmap(main_group, rtc):
-	"""Add 4x4 day-of-week color indicator using Bitmap (OPTIMIZED: 1 object vs 25)"""
-	day_color = get_day_color(rtc)
+def _build_day_indicator_bitmap():
+	"""Build the 5x5 day indicator mask (4x4 square + 1px margin on left/bottom)"""
+	size = DayIndicator.SIZE
+	bitmap = displayio.Bitmap(size + 1, size + 1, 2)  # 2 colors: black, day color (new bitmaps are all 0)
+
+	# Fill 4x4 colored square (offset by 1 to leave left/top margin)
+	for y in range(0, size):
+		for x in range(1, size + 1):
+			bitmap[x, y] = 1
+	return bitmap
 
-	# Create 5x5 bitmap (4x4 square + 1px margin on left/bottom)
-	width = DayIndicator.SIZE + 1  # 5 pixels
-	height = DayIndicator.SIZE + 1  # 5 pixels
+# The mask is the same every day - only the palette changes
+_DAY_INDICATOR_BITMAP = _build_day_indicator_bitmap()
 
-	bitmap = displayio.Bitmap(width, height, 2)  # 2 colors: black, day color
+def add_day_indicator_bitmap(main_group, rtc):
+	"""Add 4x4 day-of-week color indicator using Bitmap (OPTIMIZED: 1 object vs 25)"""
 	palette = displayio.Palette(2)
 	palette[0] = state.colors["BLACK"]  # Margin color
-	palette[1] = day_color              # Day color
-
-	# Fill entire bitmap with black (margin)
-	for y in range(height):
-		for x in range(width):
-			bitmap[x, y] = 0
-
-	# Fill 4x4 colored square (offset by 1 to leave left/top margin)
-	for y in range(0, DayIndicator.SIZE):
-		for x in range(1, DayIndicator.SIZE + 1):
-			bitmap[x, y] = 1
+	palette[1] = get_day_color(rtc)     # Day color
 
 	# Create TileGrid at correct position (offset -1 for margin)
 	day_grid = displayio.TileGrid(
-		bitmap,
+		_DAY_INDICATOR_BITMAP,
 		pixel_shader=palette,
 		x=DayIndicator.MARGIN_LEFT_X,  # Position includes margin
 		y=DayIndicator.Y
@@ -3402,41 +3773,54 @@ def calculate_humidity_bar_length(humidity):
 	else:
 		return pixels + 4
 		
+# Indicator bar bitmaps keyed by (length, spacing positions) - only a handful of sizes exist
+_bar_bitmap_cache = {}
+
+def get_bar_bitmap(length, spacing_positions):
+	"""Get a 1px-tall bar bitmap (index 1) with spacing dots (index 0), built once per size"""
+	key = (length, spacing_positions)
+	bitmap = _bar_bitmap_cache.get(key)
+	if bitmap is None:
+		bitmap = displayio.Bitmap(length, 1, 2)  # width x height, 2 colors
+		bitmap.fill(1)
+		for x in spacing_positions:
+			if x < length:
+				bitmap[x, 0] = 0
+		_bar_bitmap_cache[key] = bitmap
+	return bitmap
+
+# Column image paths keyed by weather icon number - built once per icon
+_column_image_paths = {}
+
+def get_column_image_path(icon_num):
+	"""Full path of the column image for a weather icon number"""
+	path = _column_image_paths.get(icon_num)
+	if path is None:
+		path = f"{Paths.COLUMN_IMAGES}/{icon_num}.bmp"
+		_column_image_paths[icon_num] = path
+	return path
+
 def add_indicator_bars_bitmap(main_group, x_start, uv_index, humidity):
 	"""Add UV and humidity bars using Bitmap (OPTIMIZED: 2 objects vs 4-10)"""
 
 	# UV bar (only if UV > 0)
 	if uv_index > 0:
-		uv_length = calculate_uv_bar_length(uv_index)
-
-		# Create UV bar bitmap
-		uv_bitmap = displayio.Bitmap(uv_length, 1, 2)  # width x height, 2 colors
+		uv_bitmap = get_bar_bitmap(calculate_uv_bar_length(uv_index), Visual.UV_SPACING_POSITIONS)
 		uv_palette = displayio.Palette(2)
 		uv_palette[0] = state.colors["BLACK"]  # Spacing dots
 		uv_palette[1] = state.colors["DIMMEST_WHITE"]  # Bar color
 
-		# Fill bar with color, add black spacing dots
-		for x in range(uv_length):
-			uv_bitmap[x, 0] = 0 if x in Visual.UV_SPACING_POSITIONS else 1
-
 		# Create TileGrid
 		uv_grid = displayio.TileGrid(uv_bitmap, pixel_shader=uv_palette, x=x_start, y=Layout.UV_BAR_Y)
 		main_group.append(uv_grid)
 
 	# Humidity bar
 	if humidity > 0:
-		humidity_length = calculate_humidity_bar_length(humidity)
-
-		# Create humidity bar bitmap
-		humidity_bitmap = displayio.Bitmap(humidity_length, 1, 2)
+		humidity_bitmap = get_bar_bitmap(calculate_humidity_bar_length(humidity), Visual.HUMIDITY_SPACING_POSITIONS)
 		humidity_palette = displayio.Palette(2)
 		humidity_palette[0] = state.colors["BLACK"]  # Spacing dots
 		humidity_palette[1] = state.colors["DIMMEST_WHITE"]  # Bar color
 
-		# Fill bar with color, add black spacing dots
-		for x in range(humidity_length):
-			humidity_bitmap[x, 0] = 0 if x in Visual.HUMIDITY_SPACING_POSITIONS else 1
-
 		# Create TileGrid
 		humidity_grid = displayio.TileGrid(humidity_bitmap, pixel_shader=humidity_palette, x=x_start, y=Layout.HUMIDITY_BAR_Y)
 		main_group.append(humidity_grid)
@@ -3583,23 +3967,23 @@ def show_weather_display(rtc, duration, weather_data=None):
 		elif loop_count % Timing.MEMORY_CHECK_INTERVAL == 0:
 			state.memory_monitor.check_memory(f"weather_display_loop_{loop_count}")
 		
-		# Get current time
-		hour = rtc.datetime.tm_hour
-		minute = rtc.datetime.tm_min
+		# Get current time (single RTC read)
+		now = rtc.datetime
+		hour = now.tm_hour
+		minute = now.tm_min
 		
 		# Only update display when minute changes (not every second)
 		if minute != last_minute:
-			display_hour = get_12h_hour(hour)
-			current_time = f"{display_hour}:{minute:02d}"
-			
 			# Update ONLY the time text content
-			time_text.text = current_time
+			time_text.text = format_clock_time(hour, minute)
 
-			# Position time text based on other elements
+			# Position time text based on other elements, using the label's own
+			# freshly laid-out width instead of measuring the string again
+			time_width = time_text.bounding_box[2]
 			if feels_shade_text:
-				time_text.x = 0 + (Display.WIDTH - state.text_cache.get_text_width(current_time, font)) // 2
+				time_text.x = (Display.WIDTH - time_width) // 2
 			else:
-				time_text.x = right_align_text(current_time, font, Layout.RIGHT_EDGE)
+				time_text.x = Layout.RIGHT_EDGE - time_width
 			
 			last_minute = minute
 		
@@ -3666,16 +4050,22 @@ def show_clock_display(rtc, duration=Timing.CLOCK_DISPLAY_DURATION):
 	add_weekday_indicator_if_enabled(state.main_group, rtc, "Clock")
 	
 	start_time = time.monotonic()
+	last_second = -1
+	last_day = None
 	while time.monotonic() - start_time < duration:
 		dt = rtc.datetime
-		date_str = f"{MONTHS[dt.tm_mon].upper()} {dt.tm_mday:02d}"
-
-		hour = dt.tm_hour
-		display_hour = get_12h_hour(hour)
-		time_str = f"{display_hour}:{dt.tm_min:02d}:{dt.tm_sec:02d}"
+		second = dt.tm_sec
+		
+		# Only rebuild strings when the displayed values actually change
+		if second != last_second:
+			day_key = (dt.tm_mon, dt.tm_mday)
+			if day_key != last_day:
+				date_text.text = f"{MONTHS[dt.tm_mon].upper()} {dt.tm_mday:02d}"
+				last_day = day_key
+			
+			time_text.text = format_clock_time(dt.tm_hour, dt.tm_min) + ":" + _TWO_DIGIT_STR[second]
+			last_second = second
 		
-		date_text.text = date_str
-		time_text.text = time_str
 		interruptible_sleep(1)
 	
 	# Check for restart conditions ONLY if not in startup phase
@@ -3694,7 +4084,8 @@ def show_clock_display(rtc, duration=Timing.CLOCK_DISPLAY_DURATION):
 		
 def show_event_display(rtc, duration):
 	"""Display special calendar events - cycles through multiple events if present"""
-	state.memory_monitor.check_memory("event_display_start")
+	if DEBUG_MEMORY:
+		state.memory_monitor.check_memory("event_display_start")
 	
 	# Get currently active events
 	num_events, event_list = get_today_events_info(rtc)
@@ -3744,7 +4135,8 @@ def show_event_display(rtc, duration):
 		log_verbose(f"Showing {num_events} events, {duration_message(event_duration)} each")
 		
 		for i, event_data in enumerate(event_list):
-			state.memory_monitor.check_memory(f"event_{i+1}_start")
+			if DEBUG_MEMORY:
+				state.memory_monitor.check_memory(f"event_{i+1}_start")
 			log_info(f"Event {i+1}/{num_events}: {event_data[0]} {event_data[1]}")
 			_display_single_event_optimized(event_data, rtc, event_duration)
 	
@@ -3754,22 +4146,21 @@ def show_event_display(rtc, duration):
 def _display_single_event_optimized(event_data, rtc, duration):
 	"""Optimized helper function to display a single event"""
 	clear_display()
-	
-	# Force garbage collection before loading images
-	gc.collect()
-	state.memory_monitor.check_memory("single_event_start")
+	if DEBUG_MEMORY:
+		state.memory_monitor.check_memory("single_event_start")
 	
 	# Load image - fallback to blank if primary fails
 	bitmap = None
 	palette = None
 
-	if event_data[0] == "Birthday":
-		# Try birthday cake image
-		bitmap, palette = state.image_cache.get_image(Paths.BIRTHDAY_IMAGE)
+	# Birthday cake or event-specific image (path precomputed by parse_event_data)
+	if len(event_data) > 6:
+		image_file = event_data[6]
+	elif event_data[0] == "Birthday":
+		image_file = Paths.BIRTHDAY_IMAGE
 	else:
-		# Try event-specific image
 		image_file = f"{Paths.EVENT_IMAGES}/{event_data[2]}"
-		bitmap, palette = state.image_cache.get_image(image_file)
+	bitmap, palette = state.image_cache.get_image(image_file)
 
 	# Try blank if primary failed (check return value, not exception)
 	if bitmap is None:
@@ -3798,7 +4189,10 @@ def _display_single_event_optimized(event_data, rtc, duration):
 			text_color = event_data[3] if len(event_data) > 3 else Strings.DEFAULT_EVENT_COLOR
 			
 			# Color map through dictionary access:
-			line2_color = state.colors.get(text_color.upper(), state.colors[Strings.DEFAULT_EVENT_COLOR])
+			line2_color = state.color_lut.get(text_color)
+			if line2_color is None:
+				# Mixed-case names miss the LUT; normalize only in that rare case
+				line2_color = state.colors.get(text_color.upper(), state.colors[Strings.DEFAULT_EVENT_COLOR])
 			
 			# Get dynamic positions
 			line1_y, line2_y = calculate_bottom_aligned_positions(
@@ -3835,37 +4229,34 @@ def _display_single_event_optimized(event_data, rtc, duration):
 			add_weekday_indicator_if_enabled(state.main_group, rtc, "Event")		
 		
 		# Simple strategy optimized for usage patterns
-		if duration <= Timing.EVENT_CHUNK_SIZE:
-			# Most common case: 10-60 second events, just sleep
+		if not DEBUG_MEMORY or duration <= Timing.EVENT_MEMORY_MONITORING:
+			# Most common case: nothing to do mid-event, just sleep
 			interruptible_sleep(duration)
 		else:
-			# Rare case: all-day events, use 60-second chunks with minimal monitoring
+			# All-day events while debugging memory: one sleep per monitoring block
 			elapsed = 0
-			chunk_size = Timing.EVENT_CHUNK_SIZE  # 1-minute chunks for long events
+			step_size = Timing.EVENT_MEMORY_MONITORING  # Every 10 minutes
 			
 			while elapsed < duration:
-				remaining = duration - elapsed
-				sleep_time = min(chunk_size, remaining)
+				step = min(step_size, duration - elapsed)
+				interruptible_sleep(step)
+				elapsed += step
 				
-				interruptible_sleep(sleep_time)
-				elapsed += sleep_time
-				
-				# Very minimal monitoring for all-day events (every 10 minutes)
-				if elapsed % Timing.EVENT_MEMORY_MONITORING == 0:  # Every 10 minutes
-					state.memory_monitor.check_memory(f"event_display_allday_{int(elapsed//System.SECONDS_PER_MINUTE)}min")
+				state.memory_monitor.check_memory(f"event_display_allday_{int(elapsed//System.SECONDS_PER_MINUTE)}min")
 		
 	except Exception as e:
 		log_error(f"Event display error: {e}")
-		state.memory_monitor.check_memory("single_event_error")
+		if DEBUG_MEMORY:
+			state.memory_monitor.check_memory("single_event_error")
 	
 	# Clean up after event display
 	gc.collect()
-	state.memory_monitor.check_memory("single_event_complete")
+	if DEBUG_MEMORY:
+		state.memory_monitor.check_memory("single_event_complete")
 			
 def show_color_test_display(duration=Timing.COLOR_TEST):
 	log_debug(f"Displaying Color Test for {duration_message(Timing.COLOR_TEST)}")
 	clear_display()
-	gc.collect()
 	
 	try:
 		# Get test colors dynamically from COLORS dictionary
@@ -3874,6 +4265,7 @@ def show_color_test_display(duration=Timing.COLOR_TEST):
 		texts = ["Aa", "Bb", "Cc", "Dd", "Ee", "Ff", "Gg", "Hh", "Ii", "Jj", "Kk", "Ll"]
 		
 		key_text = "Color Key: "
+		key_parts = []
 		
 		for i, (color_name, text) in enumerate(zip(test_color_names, texts)):
 			color = state.colors[color_name]
@@ -3885,7 +4277,9 @@ def show_color_test_display(duration=Timing.COLOR_TEST):
 				x=Layout.COLOR_TEST_TEXT_X + col * Visual.COLOR_TEST_COL_SPACING , y=Layout.COLOR_TEST_TEXT_Y + row * Visual.COLOR_TEST_ROW_SPACING
 			)
 			state.main_group.append(label)
-			key_text += f"{text}={color_name}(0x{color:06X}) | "
+			key_parts.append(f"{text}={color_name}(0x{color:06X})")
+		
+		key_text += " | ".join(key_parts)
 	
 	except Exception as e:
 		log_error(f"Color Test display error: {e}")
@@ -3909,12 +4303,7 @@ def show_icon_test_display(icon_numbers=None, duration=Timing.ICON_TEST):
 		# Original behavior - cycle through all icons
 		log_info("Starting Icon Test Display - All Icons (Ctrl+C to exit)")
 		
-		# AccuWeather icon numbers (skipping 9, 10, 27, 28)
-		all_icons = []
-		for i in range(1, 45):
-			if i not in [9, 10, 27, 28]:
-				all_icons.append(i)
-		
+		all_icons = TestData.VALID_ICON_NUMBERS
 		total_icons = len(all_icons)
 		icons_per_batch = 3
 		num_batches = (total_icons + icons_per_batch - 1) // icons_per_batch
@@ -3929,9 +4318,7 @@ def show_icon_test_display(icon_numbers=None, duration=Timing.ICON_TEST):
 				
 				_display_icon_batch(batch_icons, batch_num + 1, num_batches)
 				
-				# Shorter sleep intervals for better interrupt response
-				for _ in range(int(duration * 10)):
-					time.sleep(0.1)
+				interruptible_sleep(duration)
 					
 		except KeyboardInterrupt:
 			log_info("Icon test interrupted by user")
@@ -3949,7 +4336,7 @@ def show_icon_test_display(icon_numbers=None, duration=Timing.ICON_TEST):
 		# Loop indefinitely until interrupted
 		try:
 			while True:
-				time.sleep(0.1)  # Keep display active, check for interrupt
+				interruptible_sleep(System.SECONDS_PER_HOUR)  # Keep display active, check for interrupt
 		except KeyboardInterrupt:
 			log_info("Icon test interrupted")
 			clear_display()
@@ -3967,15 +4354,11 @@ def _display_icon_batch(icon_numbers, batch_num=None, total_batches=None, manual
 		log_info(f"Batch {batch_num}/{total_batches}: Icons {icon_numbers}")
 	
 	clear_display()
-	gc.collect()
 	
 	try:
 		# Position icons horizontally (up to 3)
-		positions = [
-			(Layout.ICON_TEST_COL1_X, Layout.ICON_TEST_ROW1_Y),  # Left
-			(Layout.ICON_TEST_COL2_X, Layout.ICON_TEST_ROW1_Y),  # Center
-			(Layout.ICON_TEST_COL3_X, Layout.ICON_TEST_ROW1_Y),  # Right
-		]
+		positions = Layout.ICON_TEST_POSITIONS
+		number_x_offsets = Layout.ICON_NUMBER_X_OFFSET
 		
 		for i, icon_num in enumerate(icon_numbers):
 			if i >= len(positions):
@@ -3985,7 +4368,7 @@ def _display_icon_batch(icon_numbers, batch_num=None, total_batches=None, manual
 			
 			# Load icon image
 			try:
-				bitmap, palette = state.image_cache.get_image(f"{Paths.COLUMN_IMAGES}/{icon_num}.bmp")
+				bitmap, palette = state.image_cache.get_image(get_column_image_path(icon_num))
 				icon_img = displayio.TileGrid(bitmap, pixel_shader=palette)
 				icon_img.x = x
 				icon_img.y = y
@@ -4007,7 +4390,7 @@ def _display_icon_batch(icon_numbers, batch_num=None, total_batches=None, manual
 				font,
 				color=state.colors["DIMMEST_WHITE"],
 				text=str(icon_num),
-				x=x + (5 if icon_num < 10 else 3),  # Center single vs double digits
+				x=x + (number_x_offsets[icon_num] if icon_num < len(number_x_offsets) else 3),
 				y=y + Layout.ICON_TEST_NUMBER_Y_OFFSET
 			)
 			state.main_group.append(number_label)
@@ -4015,6 +4398,40 @@ def _display_icon_batch(icon_numbers, batch_num=None, total_batches=None, manual
 	except Exception as e:
 		log_error(f"Icon display error: {e}")
 
+# Formatted price strings keyed by (prefix, whole dollars or cents) - the same
+# few prices are re-rendered every rotation while markets are closed
+_price_format_cache = {}
+_PRICE_FORMAT_CACHE_MAX = 64
+
+def _format_thousands(value):
+	"""Format a non-negative int with comma separators using integer math ("{:,}" fallback past a billion)"""
+	if value < 1000:
+		return "%d" % value
+	if value < 1000000:
+		return "%d,%03d" % divmod(value, 1000)
+	if value < 1000000000:
+		return "%d,%03d,%03d" % (value // 1000000, value // 1000 % 1000, value % 1000)
+	return "{:,}".format(value)
+
+def _cached_price_format(prefix, price):
+	"""Format price as "<prefix>86,932" (>= 1000) or "<prefix>18.49", reusing earlier strings"""
+	large = price >= 1000
+	key = (prefix, large, int(price) if large else int(round(price * 100)))
+
+	text = _price_format_cache.get(key)
+	if text is None:
+		if large:
+			# Remove cents and add comma separators for thousands
+			text = prefix + _format_thousands(int(price))
+		else:
+			# Under 1000, show with 2 decimals
+			text = f"{prefix}{price:.2f}"
+
+		if len(_price_format_cache) >= _PRICE_FORMAT_CACHE_MAX:
+			_price_format_cache.clear()
+		_price_format_cache[key] = text
+	return text
+
 def format_price_with_suffix(price):
 	"""Format prices for forex/crypto/commodity display
 
@@ -4028,12 +4445,7 @@ def format_price_with_suffix(price):
 		18.49 → "18.49"
 		1500000 → "1,500,000"
 	"""
-	if price >= 1000:
-		# Remove cents and add comma separators for thousands
-		return f"{int(price):,}"
-	else:
-		# Under 1000, show with 2 decimals
-		return f"{price:.2f}"
+	return _cached_price_format("", price)
 
 def format_price_with_dollar(price):
 	"""Format price with dollar sign, using comma separators for large values.
@@ -4053,10 +4465,7 @@ def format_price_with_dollar(price):
 		1234.56 → "$1,234"
 		226.82 → "$226.82"
 	"""
-	if price >= 1000:
-		return "${:,}".format(int(price))
-	else:
-		return "${:.2f}".format(price)
+	return _cached_price_format("$", price)
 
 def get_stock_display_name(symbol):
 	"""Get display name for a stock symbol from cached stocks list.
@@ -4071,10 +4480,12 @@ def get_stock_display_name(symbol):
 		"USDMXN" → "MXN" (if display_name is set)
 		"CRM" → "CRM" (if no display_name)
 	"""
-	for stock in state.cached_stocks:
-		if stock["symbol"] == symbol:
-			return stock.get("display_name", symbol)
-	return symbol
+	return state.stock_display_name_map.get(symbol, symbol)
+
+def set_cached_stocks(stocks):
+	"""Replace the cached stocks list and rebuild the symbol → display name map"""
+	state.cached_stocks = stocks
+	state.stock_display_name_map = {stock.symbol: stock.display_name for stock in stocks}
 
 def show_stocks_display(duration, offset, rtc):
 	"""Display stock/forex/crypto/commodity market data - 3 items at a time
@@ -4093,7 +4504,8 @@ def show_stocks_display(duration, offset, rtc):
 	Returns:
 		tuple: (success: bool, next_offset: int)
 	"""
-	state.memory_monitor.check_memory("stocks_display_start")
+	if DEBUG_MEMORY:
+		state.memory_monitor.check_memory("stocks_display_start")
 
 	# Check if stocks are configured
 	if not state.cached_stocks:
@@ -4116,7 +4528,7 @@ def show_stocks_display(duration, offset, rtc):
 	should_fetch = state.should_fetch_stocks
 
 	# Check if current batch of stocks are cached (not just any stocks)
-	current_batch_cached = all(s["symbol"] in state.cached_stock_prices for s in stocks_to_fetch)
+	current_batch_cached = all(s.symbol in state.cached_stock_prices for s in stocks_to_fetch)
 
 	# If not fetching (outside market hours) and current batch not cached, fetch once
 	if not should_fetch and not current_batch_cached:
@@ -4138,7 +4550,7 @@ def show_stocks_display(duration, offset, rtc):
 			time.sleep(wait_time)
 
 		# Fetch prices for 4 stocks (3 to display + 1 buffer)
-		log_verbose(f"Fetching prices for: {', '.join([s['symbol'] for s in stocks_to_fetch])}")
+		log_verbose(f"Fetching prices for: {', '.join([s.symbol for s in stocks_to_fetch])}")
 		stock_prices = fetch_stock_prices(stocks_to_fetch)
 		state.last_stock_fetch_time = time.monotonic()
 
@@ -4165,20 +4577,20 @@ def show_stocks_display(duration, offset, rtc):
 	stocks_to_show = []
 	failed_tickers = []
 	for stock_symbol in stocks_to_fetch:
-		symbol = stock_symbol["symbol"]
+		symbol = stock_symbol.symbol
 		if symbol in stock_prices:
 			stocks_to_show.append({
 				"symbol": symbol,
-				"name": stock_symbol["name"],
-				"type": stock_symbol.get("type", "stock"),  # Default to stock for backward compatibility
-				"display_name": stock_symbol.get("display_name", symbol),  # Use symbol if no display_name
+				"name": stock_symbol.name,
+				"type": stock_symbol.type,
+				"display_name": stock_symbol.display_name,
 				"price": stock_prices[symbol]["price"],
 				"change_percent": stock_prices[symbol]["change_percent"],
 				"direction": stock_prices[symbol]["direction"]
 			})
 		else:
-			failed_tickers.append(stock_symbol.get("display_name", symbol))
-			log_warning(f"Failed to fetch ticker '{stock_symbol.get('display_name', symbol)}' ({symbol}) - check symbol is valid")
+			failed_tickers.append(stock_symbol.display_name)
+			log_warning(f"Failed to fetch ticker '{stock_symbol.display_name}' ({symbol}) - check symbol is valid")
 
 	# Progressive degradation: show 3 if available, 2 if only 2, skip if <2
 	if len(stocks_to_show) < 2:
@@ -4202,7 +4614,7 @@ def show_stocks_display(duration, offset, rtc):
 	# Build condensed log message with market status and stock/forex/crypto/commodity details
 	detail_parts = []
 	for s in stocks_to_show:
-		display_name = s.get('display_name', s['symbol'])
+		display_name = s['display_name']
 		item_type = s.get('type', 'stock')
 		if item_type == 'stock':
 			# Stock: Show percentage change
@@ -4224,7 +4636,17 @@ def show_stocks_display(duration, offset, rtc):
 	try:
 		# Display stocks/forex in vertical rows (2-3 items depending on buffer success)
 		# Row positions (dividing 32px height into 3 sections)
-		row_positions = [2, 13, 24]  # Y positions for each row
+		row_positions = (2, 13, 24)  # Y positions for each row
+
+		# Bind per-row lookups once for the loop
+		colors = state.colors
+		up_color = colors["GREEN"]
+		down_color = colors["RED"]
+		ticker_color = colors["DIMMEST_WHITE"]
+		value_right_edge = Display.WIDTH - 1  # Right-align with 1px margin
+		append = state.main_group.append
+		label_font = font
+		text_width = state.text_cache.get_text_width
 
 		for i, stock in enumerate(stocks_to_show):
 			if i >= 3:  # Max 3 items (stocks/forex) per display
@@ -4232,12 +4654,10 @@ def show_stocks_display(duration, offset, rtc):
 
 			y_pos = row_positions[i]
 			item_type = stock.get("type", "stock")
+			is_up = stock["direction"] == "up"
 
 			# Determine color based on direction
-			if stock["direction"] == "up":
-				color = state.colors["GREEN"]
-			else:
-				color = state.colors["RED"]
+			color = up_color if is_up else down_color
 
 			# Format value based on type
 			if item_type == "stock":
@@ -4250,23 +4670,23 @@ def show_stocks_display(duration, offset, rtc):
 				value_text = format_price_with_suffix(stock['price'])
 
 			# Calculate right-aligned position for value (1px margin from right edge)
-			value_width = get_text_width(value_text, font)
-			value_x = Display.WIDTH - value_width - 1  # Right-align with 1px margin
+			value_x = value_right_edge - text_width(value_text, label_font)
 
 			# Create indicator (left side, centered with text)
-			if item_type in ["forex", "crypto", "commodity"]:
+			if item_type in ("forex", "crypto", "commodity"):
 				# Forex/Crypto/Commodity: Dollar sign indicator
-				indicator_label = bitmap_label.Label(
-					font,
+				indicator_label = get_pooled_label(
+					("stock_indicator", i),
+					label_font,
 					color=color,  # Use direction color
 					text="$",
 					x=1,
 					y=y_pos
 				)
-				state.main_group.append(indicator_label)
+				append(indicator_label)
 			else:
 				# Stock: Triangle arrow indicator
-				if stock["direction"] == "up":
+				if is_up:
 					# Up triangle: ▲ pointing upward
 					arrow_triangle = Triangle(
 						1, y_pos + 4,   # Bottom left
@@ -4282,29 +4702,30 @@ def show_stocks_display(duration, offset, rtc):
 						5, y_pos + 1,   # Top right
 						fill=color
 					)
-				state.main_group.append(arrow_triangle)
-
-			# Ticker symbol (use display_name if available)
-			display_text = stock.get("display_name", stock["symbol"])
-			ticker_label = bitmap_label.Label(
-				font,
-				color=state.colors["DIMMEST_WHITE"],
-				text=display_text,
+				append(arrow_triangle)
+
+			# Ticker symbol (display_name falls back to the symbol at parse time)
+			ticker_label = get_pooled_label(
+				("stock_ticker", i),
+				label_font,
+				color=ticker_color,
+				text=stock["display_name"],
 				x=8,
 				y=y_pos
 			)
-			state.main_group.append(ticker_label)
+			append(ticker_label)
 
 			# Value (percentage or price, right-aligned)
 			# All types use direction-based coloring (green for up, red for down)
-			value_label = bitmap_label.Label(
-				font,
+			value_label = get_pooled_label(
+				("stock_value", i),
+				label_font,
 				color=color,
 				text=value_text,
 				x=value_x,
 				y=y_pos
 			)
-			state.main_group.append(value_label)
+			append(value_label)
 			
 		# Add day indicator
 		add_weekday_indicator_if_enabled(state.main_group, rtc, "Stocks")
@@ -4324,18 +4745,20 @@ def show_stocks_display(duration, offset, rtc):
 
 	except Exception as e:
 		log_error(f"Stocks display error: {e}")
-		state.memory_monitor.check_memory("stocks_display_error")
+		if DEBUG_MEMORY:
+			state.memory_monitor.check_memory("stocks_display_error")
 		return (False, offset)
 
 	gc.collect()
-	state.memory_monitor.check_memory("stocks_display_complete")
+	if DEBUG_MEMORY:
+		state.memory_monitor.check_memory("stocks_display_complete")
 	return (True, next_offset)
 
 def get_stock_display_mode(stocks_list, offset):
 	"""Determine if we should show chart or multi-stock based on highlight flags.
 
 	Args:
-		stocks_list: List of stock dicts with 'highlight' field
+		stocks_list: List of Stock tuples
 		offset: Current rotation offset
 
 	Returns:
@@ -4351,16 +4774,12 @@ def get_stock_display_mode(stocks_list, offset):
 	current_stock = stocks_list[offset]
 
 	# Check if current stock is highlighted
-	if current_stock.get("highlight", False):
+	if current_stock.highlight:
 		# Show chart for this highlighted stock
-		return ("chart", current_stock["symbol"])
-
-	# Current stock is NOT highlighted - check edge case
-	# Edge case: All stocks are highlighted (shouldn't happen in normal rotation)
-	# In this case, just show first stock as chart
-	if all(s.get("highlight", False) for s in stocks_list):
-		return ("chart", stocks_list[0]["symbol"])
+		return ("chart", current_stock.symbol)
 
+	# Current stock is NOT highlighted, so the list can't be all-highlighted
+	# (that case always returns "chart" above) - no need to scan the list
 	# Normal case: show multi-stock mode
 	# The show_stocks_display function will handle fetching and display
 	return ("multi", None)
@@ -4398,8 +4817,9 @@ def show_single_stock_chart(ticker, duration, rtc):
 
 	# Also check cache age (don't fetch too frequently during market hours)
 	# Only skip fetch if we actually have cached data
-	if should_fetch and ticker in state.last_intraday_fetch_time and ticker in state.cached_intraday_data:
-		time_since_fetch = current_time - state.last_intraday_fetch_time[ticker]
+	cached = state.cached_intraday_data.get(ticker)
+	if should_fetch and cached:
+		time_since_fetch = current_time - cached["timestamp"]
 		if time_since_fetch < INTRADAY_CACHE_MAX_AGE:
 			should_fetch = False
 			log_verbose("Using cached intraday data for " + ticker + " (recently fetched)")
@@ -4449,21 +4869,19 @@ def show_single_stock_chart(ticker, duration, rtc):
 		log_info(f"Fetching intraday data for {ticker} (5min interval, {intervals_elapsed} points)")
 		time_series = fetch_intraday_time_series(ticker, interval="5min", outputsize=intervals_elapsed)
 
-		if not time_series or len(time_series) == 0:
+		if not time_series or len(time_series["close_price"]) == 0:
 			log_warning("No intraday data available for " + ticker)
 			return False
 
 		# Check if data is from today (market close detection)
 		# Most recent point is last in the list (ordered chronologically)
 		if rtc and time_series:
-			latest_point = time_series[-1]
-			latest_datetime = latest_point.get("datetime", "")
+			latest_datetime = time_series["datetime"][-1]
 
 			# Extract date from datetime string (format: "2024-12-06 10:00:00")
 			if latest_datetime and len(latest_datetime) >= 10:
 				latest_date = latest_datetime[:10]  # Get YYYY-MM-DD
-				now = rtc.datetime
-				today_date = f"{now.tm_year:04d}-{now.tm_mon:02d}-{now.tm_mday:02d}"
+				today_date = format_date_str(rtc.datetime)
 
 				if latest_date != today_date:
 					# Data is from previous day - market is closed (weekend/holiday)
@@ -4472,43 +4890,59 @@ def show_single_stock_chart(ticker, duration, rtc):
 					# Set full chart flag so we use all the data we got
 					data_is_fresh = False  # Mark as not fresh since it's old data
 
-		# Note: We'll get the actual opening price from the quote API later
-		# For now, just cache the time series data
+		# Cache the time series (its timestamp also drives the refetch interval above)
 		state.cached_intraday_data[ticker] = {
 			"data": time_series,
 			"timestamp": current_time
 		}
-		state.last_intraday_fetch_time[ticker] = current_time
 
 	# Get cached data
-	if ticker not in state.cached_intraday_data:
+	cached = state.cached_intraday_data.get(ticker)
+	if not cached:
 		log_warning("No cached data for " + ticker)
 		return False
 
-	cached = state.cached_intraday_data[ticker]
 	time_series = cached["data"]
+	close_prices = time_series["close_price"]
 
 	# Log cache usage if not fetching fresh
 	if not data_is_fresh:
-		log_verbose(f"Using cached chart data for {ticker} ({len(time_series)} points, outside market hours)")
-
-	# Fetch current quote for latest price and percentage
-	quote_data = fetch_stock_prices([{"symbol": ticker, "name": ticker}])
+		log_verbose(f"Using cached chart data for {ticker} ({len(close_prices)} points, outside market hours)")
+
+	# For stocks with bars from today, price and day change come from the series
+	# itself: the newest close vs. the open of today's first bar. Forex/crypto/
+	# commodities trade around the clock (no session open), and a series with no
+	# bar from today is stale, so those use the quote's change vs. previous close -
+	# the same figure the stocks rotation shows.
+	stock = None
+	for item in state.cached_stocks:
+		if item.symbol == ticker:
+			stock = item
+			break
+	if stock is None:
+		stock = Stock(ticker, ticker, "stock", ticker, True)
+
+	session_open = time_series["session_open"]
+	if (stock.type == "stock" and session_open > 0 and rtc
+			and time_series["session_date"] == format_date_str(rtc.datetime)):
+		current_price = close_prices[-1]
+		change_percent = (current_price - session_open) / session_open * 100.0
+	else:
+		quote = state.cached_stock_prices.get(ticker)
+		if not quote or time.monotonic() - quote["timestamp"] > Timing.STOCK_CACHE_MAX_AGE:
+			quote = fetch_stock_prices([stock]).get(ticker)
 
-	if ticker not in quote_data:
-		log_warning("Could not fetch current quote for " + ticker)
-		return False
+		if not quote:
+			log_warning("Could not fetch current quote for " + ticker)
+			return False
 
-	current_price = quote_data[ticker]["price"]
-	change_percent = quote_data[ticker]["change_percent"]
-	direction = quote_data[ticker]["direction"]
-	actual_open_price = quote_data[ticker]["open_price"]
+		current_price = quote["price"]
+		change_percent = quote["change_percent"]
 
 	# Get display name (uses display_name from stocks.csv if available)
 	display_name = get_stock_display_name(ticker)
 
-	# Use the actual day's percentage change from the quote API
-	# This represents the change from market open (9:30 AM) to current price
+	# Change from today's session open (stocks) or from the previous close (quote fallback)
 	day_change_percent = change_percent
 
 	# Determine color based on direction
@@ -4525,7 +4959,8 @@ def show_single_stock_chart(ticker, duration, rtc):
 
 	try:
 		# Row 1 (y=1): Ticker + percentage
-		ticker_label = bitmap_label.Label(
+		ticker_label = get_pooled_label(
+			"chart_ticker",
 			font,
 			text=display_name,
 			color=state.colors["DIMMEST_WHITE"],
@@ -4540,11 +4975,12 @@ def show_single_stock_chart(ticker, duration, rtc):
 		else:
 			pct_text = "{:.2f}".format(day_change_percent) + "%"
 
-		pct_label = bitmap_label.Label(
+		pct_label = get_pooled_label(
+			"chart_pct",
 			font,
 			text=pct_text,
 			color=pct_color,
-			x=Layout.RIGHT_EDGE - get_text_width(pct_text, font),
+			x=Layout.RIGHT_EDGE - state.text_cache.get_text_width(pct_text, font),
 			y=1
 		)
 		state.main_group.append(pct_label)
@@ -4554,11 +4990,12 @@ def show_single_stock_chart(ticker, duration, rtc):
 
 		# Row 2 (y=9): Current price (format with commas if >= $1000, no cents)
 		price_text = format_price_with_dollar(current_price)
-		price_label = bitmap_label.Label(
+		price_label = get_pooled_label(
+			"chart_price",
 			font,
 			text=price_text,
 			color=state.colors["WHITE"],
-			x=Layout.RIGHT_EDGE - get_text_width(price_text, font),
+			x=Layout.RIGHT_EDGE - state.text_cache.get_text_width(price_text, font),
 			y=9
 		)
 		state.main_group.append(price_label)
@@ -4568,36 +5005,54 @@ def show_single_stock_chart(ticker, duration, rtc):
 		CHART_Y_START = 17
 		CHART_WIDTH = 64
 
-		# Find min and max prices for scaling
-		prices = [point["close_price"] for point in time_series]
-		min_price = min(prices)
-		max_price = max(prices)
+		# Find min and max prices for scaling in a single pass
+		min_price = max_price = close_prices[0]
+		for close_price in close_prices:
+			if close_price < min_price:
+				min_price = close_price
+			elif close_price > max_price:
+				max_price = close_price
+
 		price_range = max_price - min_price
 
-		# Handle flat line (all prices the same)
-		if price_range == 0:
-			price_range = 1
+		# Scale factor derived from the actual price range and computed once, so the
+		# loop multiplies instead of divides and low-priced or slow-moving series
+		# (e.g. forex around 1.08) still use the full chart height.
+		# A flat line, where all prices are the same, sits on the bottom row
+		y_scale = (CHART_HEIGHT - 1) / price_range if price_range else 0
+
+		num_points = len(close_prices)
+		x_span = num_points - 1 if num_points > 1 else 1
+		y_bottom = CHART_Y_START + CHART_HEIGHT - 1
 
 		# Scale prices to chart height and spread across chart width
-		data_points = []
-		num_points = len(time_series)
+		data_points = [None] * num_points
 
-		for i, point in enumerate(time_series):
+		for i in range(num_points):
 			# X position: spread evenly across 64 pixels
-			x = int((i / (num_points - 1)) * (CHART_WIDTH - 1)) if num_points > 1 else 0
-
 			# Y position: scale price to chart height (inverted because y increases downward)
-			price_scaled = (point["close_price"] - min_price) / price_range
-			y = CHART_Y_START + CHART_HEIGHT - 1 - int(price_scaled * (CHART_HEIGHT - 1))
-
-			data_points.append((x, y))
-
-		# Draw lines connecting data points
-		for i in range(len(data_points) - 1):
-			x1, y1 = data_points[i]
-			x2, y2 = data_points[i + 1]
-			line = Line(x1, y1, x2, y2, color=chart_color)
-			state.main_group.append(line)
+			# (+0.5 rounds, so float error in the scale can't drop the max a row)
+			data_points[i] = (i * (CHART_WIDTH - 1) // x_span, y_bottom - int((close_prices[i] - min_price) * y_scale + 0.5))
+
+		# Draw lines connecting data points into one reused bitmap layer
+		# instead of one Line shape per segment
+		if state.chart_bitmap is None:
+			state.chart_bitmap = displayio.Bitmap(CHART_WIDTH, CHART_HEIGHT, 2)
+			state.chart_palette = displayio.Palette(2)
+			state.chart_palette.make_transparent(0)
+			state.chart_tile = displayio.TileGrid(state.chart_bitmap, pixel_shader=state.chart_palette, x=0, y=CHART_Y_START)
+		chart_bitmap = state.chart_bitmap
+		chart_bitmap.fill(0)
+		state.chart_palette[1] = chart_color
+
+		draw_line = bitmaptools.draw_line
+		x1, y1 = data_points[0]
+		for i in range(1, num_points):
+			x2, y2 = data_points[i]
+			draw_line(chart_bitmap, x1, y1 - CHART_Y_START, x2, y2 - CHART_Y_START, 1)
+			x1, y1 = x2, y2
+
+		state.main_group.append(state.chart_tile)
 
 		# Add cache indicator (4-pixel lilac marker at top center) when using cached data
 		if not data_is_fresh:
@@ -4666,10 +5121,7 @@ def show_transit_display(rtc, duration, current_data=None):
 
 		# Build dynamic header
 		now = rtc.datetime
-		hour_12 = now.tm_hour % 12
-		if hour_12 == 0:
-			hour_12 = 12
-		time_str = f"{hour_12}:{now.tm_min:02d}"
+		time_str = format_clock_time(now.tm_hour, now.tm_min)
 
 		# Check if weather data is available
 		if current_data and "feels_like" in current_data:
@@ -4817,9 +5269,7 @@ def show_transit_display(rtc, duration, current_data=None):
 def show_forecast_display(current_data, forecast_data, display_duration, is_fresh=False):
 	"""Optimized forecast display with smart precipitation detection"""
 	
-	# CRITICAL: Aggressive cleanup
 	clear_display()
-	gc.collect()
 	state.memory_monitor.check_memory("forecast_display_start")
 	
 	# Check if we have real data
@@ -4831,29 +5281,32 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 	current_has_precip = current_data.get('has_precipitation', False)
 	forecast_indices = [0, 1]  # Default
 	
-	# Pre-extract precipitation flags (avoid nested access)
-	precip_flags = [h.get('has_precipitation', False) for h in forecast_data[:6]]
+	# Scan at most the next 6 hours in place, stopping at the first change
+	scan_end = min(6, len(forecast_data))
 	
 	if current_has_precip:
 		# Currently raining - find when it stops
-		for i in range(len(precip_flags)):
-			if not precip_flags[i]:
+		for i in range(scan_end):
+			if not forecast_data[i].get('has_precipitation', False):
 				forecast_indices = [i, min(i + 1, len(forecast_data) - 1)]
 				log_debug(f"Rain stops at hour {i+1}")
 				break
 	else:
-		# Not raining - find when it starts
+		# Not raining - find when it starts, then when it stops after that
 		rain_start = -1
 		rain_stop = -1
 		
-		for i in range(len(precip_flags)):
-			if precip_flags[i] and rain_start == -1:
+		for i in range(scan_end):
+			if forecast_data[i].get('has_precipitation', False):
 				rain_start = i
-			elif not precip_flags[i] and rain_start != -1 and rain_stop == -1:
-				rain_stop = i
 				break
 		
 		if rain_start != -1:
+			for i in range(rain_start + 1, scan_end):
+				if not forecast_data[i].get('has_precipitation', False):
+					rain_stop = i
+					break
+			
 			if rain_stop != -1:
 				forecast_indices = [rain_start, rain_stop]
 				log_debug(f"Rain: hour {rain_start+1} to {rain_stop+1}")
@@ -4863,15 +5316,13 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 	
 	# Simple duplicate hour check
 	current_hour = state.rtc_instance.datetime.tm_hour
-	first_forecast_hour = int(forecast_data[forecast_indices[0]]['datetime'][11:13]) % 24
+	first_forecast_hour = int(forecast_data[forecast_indices[0]]['datetime'][11:13]) % System.HOURS_IN_DAY
 	
 	if first_forecast_hour == current_hour and forecast_indices[0] == 0 and len(forecast_data) >= 3:
 		forecast_indices = [1, 2]
+		first_forecast_hour = None  # Column 2 moved; re-parse below
 		log_debug(f"Adjusted to skip duplicate hour {current_hour}, Will show hours: {forecast_indices[0]+1} and {forecast_indices[1]+1}")
 	
-	clear_display()
-	gc.collect()
-	
 	# LOG what we're about to display
 	current_temp = round(current_data["feels_like"])
 	next_temps = [round(h["feels_like"]) for h in forecast_data[:2]]
@@ -4883,41 +5334,36 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 		
 		# Column 1 - feels-like temperature and icon
 		col1_temp = f"{current_temp}°"
-		col1_icon = f"{current_data['weather_icon']}.bmp"
+		col1_icon = get_column_image_path(current_data['weather_icon'])
+		
+		col2_forecast = forecast_data[forecast_indices[0]]
+		col3_forecast = forecast_data[forecast_indices[1]]
 		
 		# Column 2 - feels-like temperature and icon
-		col2_temp = f"{round(forecast_data[forecast_indices[0]]['feels_like'])}°"
-		col2_icon = f"{forecast_data[forecast_indices[0]]['weather_icon']}.bmp"
+		col2_temp = f"{round(col2_forecast['feels_like'])}°"
+		col2_icon = get_column_image_path(col2_forecast['weather_icon'])
 		
 		# Column 3 - feels-like temperature and icon
-		col3_temp = f"{round(forecast_data[forecast_indices[1]]['feels_like'])}°"
-		col3_icon = f"{forecast_data[forecast_indices[1]]['weather_icon']}.bmp"
+		col3_temp = f"{round(col3_forecast['feels_like'])}°"
+		col3_icon = get_column_image_path(col3_forecast['weather_icon'])
 		
-		hour_plus_1 = int(forecast_data[forecast_indices[0]]['datetime'][11:13]) % System.HOURS_IN_DAY
-		hour_plus_2 = int(forecast_data[forecast_indices[1]]['datetime'][11:13]) % System.HOURS_IN_DAY
-		
-		# Calculate actual hours from datetime strings
-		current_hour = state.rtc_instance.datetime.tm_hour
-		col2_hour = int(forecast_data[forecast_indices[0]]['datetime'][11:13]) % System.HOURS_IN_DAY
-		col3_hour = int(forecast_data[forecast_indices[1]]['datetime'][11:13]) % System.HOURS_IN_DAY
+		# Calculate actual hours from datetime strings (each parsed once;
+		# current_hour was read for the duplicate check above)
+		col2_hour = first_forecast_hour
+		if col2_hour is None:
+			col2_hour = int(col2_forecast['datetime'][11:13]) % System.HOURS_IN_DAY
+		col3_hour = int(col3_forecast['datetime'][11:13]) % System.HOURS_IN_DAY
 		
 		# Calculate hours ahead from current time (handle midnight wraparound)
 		col2_hours_ahead = (col2_hour - current_hour) % System.HOURS_IN_DAY
 		col3_hours_ahead = (col3_hour - current_hour) % System.HOURS_IN_DAY
 		
-		# Determine colors based on hour gaps
-		# Default: both jumped ahead
-		col2_color = state.colors["MINT"]
-		col3_color = state.colors["MINT"]
-
-		# Override if col2 is immediate
-		if col2_hours_ahead <= 1:
-			col2_color = state.colors["DIMMEST_WHITE"]
-			col3_color = state.colors["DIMMEST_WHITE"]
+		# Determine colors based on hour gaps: dim if col2 is immediate, mint if both jumped ahead
+		col2_color = col3_color = state.colors["DIMMEST_WHITE" if col2_hours_ahead <= 1 else "MINT"]
 
 		# Generate static time labels for columns 2 and 3
-		col2_time = format_hour_12h(hour_plus_1)
-		col3_time = format_hour_12h(hour_plus_2)
+		col2_time = format_hour_12h(col2_hour)
+		col3_time = format_hour_12h(col3_hour)
 	except Exception as e:
 		log_error(f"Forecast data extraction error: {e}")
 		return False
@@ -4929,19 +5375,20 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 	temp_y = Layout.FORECAST_TEMP_Y
 
 	# Load weather icon columns - NO parent try block (reduces nesting to 1 level)
-	columns_data = [
-		{"image": col1_icon, "x": Layout.FORECAST_COL1_X, "temp": col1_temp},
-		{"image": col2_icon, "x": Layout.FORECAST_COL2_X, "temp": col2_temp},
-		{"image": col3_icon, "x": Layout.FORECAST_COL3_X, "temp": col3_temp}
-	]
+	# (image, x, temp) per column
+	columns_data = (
+		(col1_icon, Layout.FORECAST_COL1_X, col1_temp),
+		(col2_icon, Layout.FORECAST_COL2_X, col2_temp),
+		(col3_icon, Layout.FORECAST_COL3_X, col3_temp)
+	)
 
-	for i, col in enumerate(columns_data):
+	for i, (image, col_x, _) in enumerate(columns_data):
 		# Try primary weather icon
-		bitmap, palette = state.image_cache.get_image(f"{Paths.COLUMN_IMAGES}/{col['image']}")
+		bitmap, palette = state.image_cache.get_image(image)
 
 		# Try blank if primary failed (check return value, not exception)
 		if bitmap is None:
-			log_warning(f"Forecast column {i+1} image {col['image']} failed, trying blank")
+			log_warning(f"Forecast column {i+1} image {image} failed, trying blank")
 			bitmap, palette = state.image_cache.get_image(Paths.BLANK_COLUMN)
 			if bitmap is None:
 				log_error(f"Blank fallback failed for column {i+1}, skipping column")
@@ -4949,22 +5396,27 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 
 		# Create and add column
 		col_img = displayio.TileGrid(bitmap, pixel_shader=palette)
-		col_img.x = col["x"]
+		col_img.x = col_x
 		col_img.y = column_y
 		state.main_group.append(col_img)
 
 	# Create and display labels - wrap in try block for display errors
 	try:
+		dim_white = state.colors["DIMMEST_WHITE"]  # Shared by col1 time and all temps
+
 		# Create time labels - only column 1 will be updated
-		col1_time_label = bitmap_label.Label(
+		col1_time_label = get_pooled_label(
+			"forecast_col1_time",
 			font,
-			color=state.colors["DIMMEST_WHITE"],
+			text="",
+			color=dim_white,
 			x=max(Layout.FORECAST_COL1_X + (column_width - state.text_cache.get_text_width("00:00", font)) // 2, 1),
 			y=time_y
 		)
 
 		# Use these colors in the labels
-		col2_time_label = bitmap_label.Label(
+		col2_time_label = get_pooled_label(
+			"forecast_col2_time",
 			font,
 			color=col2_color,
 			text=col2_time,
@@ -4972,7 +5424,8 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 			y=time_y
 		)
 
-		col3_time_label = bitmap_label.Label(
+		col3_time_label = get_pooled_label(
+			"forecast_col3_time",
 			font,
 			color=col3_color,
 			text=col3_time,
@@ -4986,13 +5439,14 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 		state.main_group.append(col3_time_label)
 		
 		# Create temperature labels (all static)
-		for col in columns_data:
-			centered_x = col["x"] + (column_width - state.text_cache.get_text_width(col["temp"], font)) // 2 + 1
+		for i, (_, col_x, temp) in enumerate(columns_data):
+			centered_x = col_x + (column_width - state.text_cache.get_text_width(temp, font)) // 2 + 1
 
-			temp_label = bitmap_label.Label(
+			temp_label = get_pooled_label(
+				("forecast_temp", i),
 				font,
-				color=state.colors["DIMMEST_WHITE"],
-				text=col["temp"],
+				color=dim_white,
+				text=temp,
 				x=centered_x,
 				y=temp_y
 			)
@@ -5006,6 +5460,8 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 		start_time = time.monotonic()
 		loop_count = 0
 		last_minute = -1
+		next_minute_check = 0  # monotonic time of the next RTC read (read immediately)
+		col1_x = Layout.FORECAST_COL1_X
 
 		while time.monotonic() - start_time < display_duration:
 			loop_count += 1
@@ -5018,26 +5474,27 @@ def show_forecast_display(current_data, forecast_data, display_duration, is_fres
 				interruptible_sleep(1)
 				continue
 
-			# RTC available - check minute change
-			current_hour = state.rtc_instance.datetime.tm_hour
-			current_minute = state.rtc_instance.datetime.tm_min
-
-			if current_minute != last_minute:
-				display_hour = get_12h_hour(current_hour)
-				new_time = f"{display_hour}:{current_minute:02d}"
+			# RTC available - only read it (I2C) once the next minute boundary is due
+			loop_time = time.monotonic()
+			if loop_time >= next_minute_check:
+				now = state.rtc_instance.datetime
+				current_minute = now.tm_min
+				# Schedule the next read for just after the minute rolls over
+				next_minute_check = loop_time + System.SECONDS_PER_MINUTE - now.tm_sec
 
-				# Update ONLY the first column time text
-				col1_time_label.text = new_time
-				# Recenter the text
-				col1_time_label.x = max(Layout.FORECAST_COL1_X + (column_width - state.text_cache.get_text_width(new_time, font)) // 2, 1)
+				if current_minute != last_minute:
+					# Update ONLY the first column time text
+					col1_time_label.text = format_clock_time(now.tm_hour, current_minute)
+					# Recenter using the label's own freshly laid-out width (no re-measure)
+					col1_time_label.x = max(col1_x + (column_width - col1_time_label.bounding_box[2]) // 2, 1)
 
-				last_minute = current_minute
+					last_minute = current_minute
 
 			# Memory monitoring and cleanup
 			if loop_count % Timing.MEMORY_CHECK_INTERVAL == 0:
 				needs_gc = display_duration > Timing.GC_INTERVAL and loop_count % Timing.GC_INTERVAL == 0
 				if needs_gc:
-					gc.collect()
+					maybe_gc()
 					state.memory_monitor.check_memory(f"forecast_display_gc_{loop_count//System.SECONDS_PER_HOUR}")
 				else:
 					state.memory_monitor.check_memory(f"forecast_display_loop_{loop_count}")
@@ -5070,8 +5527,37 @@ def calculate_display_durations(rtc):
 	
 	return current_weather_time, Timing.DEFAULT_FORECAST, event_time
 
+# Static progress bar bitmap ("remaining" fill + tick marks), built once and copied per segment
+_progress_template_bitmap = None
+
+def _build_progress_template_bitmap(bar_width, total_height, bar_y_start, bar_y_end):
+	"""Build the bar's starting image: "remaining" fill with tick marks"""
+	template = displayio.Bitmap(bar_width, total_height, 4)
+	
+	# New bitmaps start at index 0 (black), so only the bar area needs
+	# filling with the "remaining" color
+	bitmaptools.fill_region(template, 0, bar_y_start, bar_width, bar_y_end, 2)
+	
+	# Add tick marks at 0%, 25%, 50%, 75%, 100%
+	tick_positions = (0, bar_width // 4, bar_width // 2, 3 * bar_width // 4, bar_width - 1)
+	
+	for pos in tick_positions:
+		# Major ticks (start, middle, end) get 2px above
+		if pos == 0 or pos == bar_width // 2 or pos == bar_width - 1:
+			template[pos, 0] = 3
+			template[pos, 1] = 3
+		else:  # Minor ticks (25%, 75%) get 1px above
+			template[pos, 1] = 3
+		
+		# All ticks get 1px below
+		template[pos, bar_y_end] = 3
+	
+	return template
+
 def create_progress_bar_tilegrid():
 	"""Create a TileGrid-based progress bar with tick marks"""
+	global _progress_template_bitmap
+	
 	# Progress bar dimensions
 	bar_width = Layout.PROGRESS_BAR_HORIZONTAL_WIDTH
 	bar_height = Layout.PROGRESS_BAR_HORIZONTAL_HEIGHT
@@ -5079,12 +5565,16 @@ def create_progress_bar_tilegrid():
 	tick_height_below = 1
 	total_height = tick_height_above + bar_height + tick_height_below  # 5px total
 	
-	# Bar position within bitmap
-	bar_y_start = tick_height_above  # Bar starts at row 2
-	bar_y_end = bar_y_start + bar_height  # Bar ends at row 4
+	if _progress_template_bitmap is None:
+		bar_y_start = tick_height_above  # Bar starts at row 2
+		_progress_template_bitmap = _build_progress_template_bitmap(
+			bar_width, total_height, bar_y_start, bar_y_start + bar_height
+		)
 	
-	# Create bitmap
+	# Each segment paints its own elapsed band, so copy the template
+	# into a fresh bitmap (one C-level blit instead of Python pixel loops)
 	progress_bitmap = displayio.Bitmap(bar_width, total_height, 4)
+	bitmaptools.blit(progress_bitmap, _progress_template_bitmap, 0, 0)
 	
 	# Create palette
 	progress_palette = displayio.Palette(4)
@@ -5093,30 +5583,6 @@ def create_progress_bar_tilegrid():
 	progress_palette[2] = state.colors["MINT"]   # Remaining
 	progress_palette[3] = state.colors["WHITE"]  # Tick marks
 	
-	# Initialize with black background
-	for y in range(total_height):
-		for x in range(bar_width):
-			progress_bitmap[x, y] = 0
-	
-	# Fill bar area with "remaining" color
-	for y in range(bar_y_start, bar_y_end):
-		for x in range(bar_width):
-			progress_bitmap[x, y] = 2
-	
-	# Add tick marks at 0%, 25%, 50%, 75%, 100%
-	tick_positions = [0, bar_width // 4, bar_width // 2, 3 * bar_width // 4, bar_width - 1]
-	
-	for pos in tick_positions:
-		# Major ticks (start, middle, end) get 2px above
-		if pos == 0 or pos == bar_width // 2 or pos == bar_width - 1:
-			progress_bitmap[pos, 0] = 3
-			progress_bitmap[pos, 1] = 3
-		else:  # Minor ticks (25%, 75%) get 1px above
-			progress_bitmap[pos, 1] = 3
-		
-		# All ticks get 1px below
-		progress_bitmap[pos, bar_y_end] = 3
-	
 	# Create TileGrid
 	progress_grid = displayio.TileGrid(
 		progress_bitmap,
@@ -5127,26 +5593,26 @@ def create_progress_bar_tilegrid():
 	
 	return progress_grid, progress_bitmap
 
-def update_progress_bar_bitmap(progress_bitmap, elapsed_seconds, total_seconds):
-	"""Update progress bar bitmap (fills left to right as time elapses)"""
+def progress_bar_width(elapsed_seconds, total_seconds):
+	"""Number of elapsed progress bar columns for the given time"""
 	if total_seconds <= 0:
-		return
-	
-	# Calculate elapsed pixels
-	elapsed_ratio = min(1.0, elapsed_seconds / total_seconds)
-	elapsed_width = int(Layout.PROGRESS_BAR_HORIZONTAL_WIDTH * elapsed_ratio)
-	
-	# Bar position (rows 2-3 in the 5-row bitmap)
-	bar_y_start = 2
-	bar_y_end = 4
+		return 0
+	return int(Layout.PROGRESS_BAR_HORIZONTAL_WIDTH * min(1.0, elapsed_seconds / total_seconds))
+
+def update_progress_bar_bitmap(progress_bitmap, elapsed_width, prev_width=0):
+	"""Paint newly elapsed columns [prev_width, elapsed_width) of the bar (fills left to right)
+
+	The bar only ever grows within a segment and each segment starts from a fresh
+	"remaining" bitmap, so columns before prev_width are already painted.
+	Returns the painted width - pass it back as prev_width on the next call.
+	"""
+	if elapsed_width <= prev_width:
+		return prev_width
 	
-	# Update only the bar area
-	for y in range(bar_y_start, bar_y_end):
-		for x in range(Layout.PROGRESS_BAR_HORIZONTAL_WIDTH):
-			if x < elapsed_width:
-				progress_bitmap[x, y] = 1  # Elapsed (LILAC)
-			else:
-				progress_bitmap[x, y] = 2  # Remaining (MINT)
+	elapsed_width = min(elapsed_width, Layout.PROGRESS_BAR_HORIZONTAL_WIDTH)
+	# Bar position (rows 2-3 in the 5-row bitmap), elapsed = LILAC
+	bitmaptools.fill_region(progress_bitmap, prev_width, 2, elapsed_width, 4, 1)
+	return elapsed_width
 		
 def get_schedule_progress():
 	"""
@@ -5209,9 +5675,19 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 	log_debug(f"Segment duration: {segment_duration}s (remaining: {remaining:.0f}s)")
 
 	# Light cleanup before segment (keep session alive for connection reuse)
-	gc.collect()
+	# - the previous segment usually just collected, so this is normally skipped
+	maybe_gc()
 	clear_display()
 
+	# Build the segment in a detached sub-group and attach it to main_group once.
+	# The group is reused, so empty it first - its pooled labels can only have one parent.
+	schedule_group = state.schedule_group
+	if schedule_group is None:
+		schedule_group = displayio.Group()
+		state.schedule_group = schedule_group
+	else:
+		empty_group(schedule_group)
+
 	# Fetch weather data (separate try block for data fetching)
 	try:
 		# Fetch weather if not provided
@@ -5245,26 +5721,27 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 	# Check if we should hide elements during night mode (used by weather and weekday sections)
 	is_night_mode = schedule_name in ["Night Mode AM", "Night Mode"]
 
+	dim_white = state.colors["DIMMEST_WHITE"]  # UV bar, temperature and clock
+
 	# === WEATHER SECTION (CONDITIONAL) - No parent try block ===
 	if current_data:
 		# Extract weather data
 		temperature = f"{round(current_data['feels_like'])}°"
-		weather_icon = f"{current_data['weather_icon']}.bmp"
+		weather_icon = get_column_image_path(current_data['weather_icon'])
 		uv_index = current_data['uv_index']
 
 		# Add UV bar if present
 		if uv_index > 0:
-			uv_length = calculate_uv_bar_length(uv_index)
-			for i in range(uv_length):
-				if i not in Visual.UV_SPACING_POSITIONS:
-					uv_pixel = Line(
-						Layout.SCHEDULE_LEFT_MARGIN_X + i,
-						Layout.SCHEDULE_UV_Y,
-						Layout.SCHEDULE_LEFT_MARGIN_X + i,
-						Layout.SCHEDULE_UV_Y,
-						state.colors["DIMMEST_WHITE"]
-					)
-					state.main_group.append(uv_pixel)
+			uv_bitmap = get_bar_bitmap(calculate_uv_bar_length(uv_index), Visual.UV_SPACING_POSITIONS)
+			uv_palette = displayio.Palette(2)
+			uv_palette[0] = state.colors["BLACK"]  # Spacing dots
+			uv_palette[1] = dim_white  # Bar color
+			schedule_group.append(displayio.TileGrid(
+				uv_bitmap,
+				pixel_shader=uv_palette,
+				x=Layout.SCHEDULE_LEFT_MARGIN_X,
+				y=Layout.SCHEDULE_UV_Y
+			))
 
 		y_offset = Layout.SCHEDULE_X_OFFSET if uv_index > 0 else 0
 
@@ -5273,7 +5750,7 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 
 		if current_data and show_weather_icon:
 			# Load weather icon - fallback to blank
-			bitmap, palette = state.image_cache.get_image(f"{Paths.COLUMN_IMAGES}/{weather_icon}")
+			bitmap, palette = state.image_cache.get_image(weather_icon)
 	
 			# Try blank if primary failed (check return value, not exception)
 			if bitmap is None:
@@ -5287,21 +5764,22 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 				weather_img = displayio.TileGrid(bitmap, pixel_shader=palette)
 				weather_img.x = Layout.SCHEDULE_LEFT_MARGIN_X
 				weather_img.y = Layout.SCHEDULE_W_IMAGE_Y + y_offset
-				state.main_group.append(weather_img)
+				schedule_group.append(weather_img)
 
 		# Set temperature color based on cache status
-		temp_color = state.colors["LILAC"] if is_cached else state.colors["DIMMEST_WHITE"]
+		temp_color = state.colors["LILAC"] if is_cached else dim_white
 
 		# Temp Labels
 
-		temp_label = bitmap_label.Label(
+		temp_label = get_pooled_label(
+			"schedule_temp",
 			font,
 			color=temp_color,
 			text=temperature,
 			x=Layout.SCHEDULE_LEFT_MARGIN_X,
 			y=Layout.SCHEDULE_TEMP_Y + y_offset
 		)
-		state.main_group.append(temp_label)
+		schedule_group.append(temp_label)
 
 	# === SCHEDULE IMAGE (ALWAYS) - Skip schedule if image fails ===
 	try:
@@ -5309,7 +5787,7 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 		schedule_img = displayio.TileGrid(bitmap, pixel_shader=palette)
 		schedule_img.x = Layout.SCHEDULE_IMAGE_X
 		schedule_img.y = Layout.SCHEDULE_IMAGE_Y
-		state.main_group.append(schedule_img)
+		schedule_group.append(schedule_img)
 		state.tracker.reset_display_errors()
 	except Exception as e:
 		log_warning(f"Failed to load schedule image {schedule_config['image']}, skipping schedule display")
@@ -5322,19 +5800,21 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 	# === CLOCK LABEL AND DISPLAY LOOP - wrap in try for display errors ===
 	try:
 		# === CLOCK LABEL (ALWAYS) ===
-		time_label = bitmap_label.Label(
+		time_label = get_pooled_label(
+			"schedule_time",
 			font,
-			color=state.colors["DIMMEST_WHITE"],
+			text="",
+			color=dim_white,
 			x=Layout.SCHEDULE_LEFT_MARGIN_X,
 			y=Layout.FORECAST_TIME_Y
 		)
-		state.main_group.append(time_label)
+		schedule_group.append(time_label)
 
 		# === WEEKDAY INDICATOR (IF ENABLED) ===
 		# Check if we should hide weekday indicator during night mode
 		show_weekday = not (display_config.night_mode_minimal_display and is_night_mode)
 		if show_weekday:
-			add_weekday_indicator_if_enabled(state.main_group, rtc, "Schedule")
+			add_weekday_indicator_if_enabled(schedule_group, rtc, "Schedule")
 			
 		# LOG what's being displayed this segment
 		segment_num = int(elapsed / Timing.SCHEDULE_SEGMENT_DURATION) + 1
@@ -5353,49 +5833,61 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 		
 		# === PROGRESS BAR ===
 		## Progress bar - based on FULL schedule progress, not segment
+		painted_width = 0  # Columns already painted as elapsed
 		if schedule_config.get("progressbar", True):
 			progress_grid, progress_bitmap = create_progress_bar_tilegrid()
 			
 			# Pre-fill progress bar based on elapsed time using existing function
 			if progress > 0:
-				update_progress_bar_bitmap(progress_bitmap, elapsed, full_duration)
+				painted_width = update_progress_bar_bitmap(progress_bitmap, progress_bar_width(elapsed, full_duration))
 				log_debug(f"Pre-filled progress bar to {progress*100:.0f}%")
 			
-			state.main_group.append(progress_grid)
+			schedule_group.append(progress_grid)
 			show_progress_bar = True
 		else:
 			progress_grid = None
 			progress_bitmap = None
 			show_progress_bar = False
 		
+		state.main_group.append(schedule_group)
+		
 		# === DISPLAY LOOP ===
 		segment_start = time.monotonic()
 		last_minute = -1
-		last_displayed_column = -1
 		
 		# Adaptive sleep for smooth updates
 		sleep_interval = max(Timing.MIN_SLEEP_INTERVAL, min(segment_duration / 60, Timing.MAX_SLEEP_INTERVAL))  # 1-5 seconds
 		
+		# Loop-invariant lookups bound once
+		bar_width = Layout.PROGRESS_BAR_HORIZONTAL_WIDTH
+		next_minute_check = 0  # monotonic time of the next RTC read (read immediately)
+		
+		# The bar only changes once per column's worth of time, so compute when the
+		# next column is due (OVERALL progress, from schedule start) and skip the math until then
+		seconds_per_column = full_duration / bar_width
+		next_column_time = segment_start + (painted_width + 1) * seconds_per_column - elapsed
+		
 		while time.monotonic() - segment_start < segment_duration:
-			current_minute = rtc.datetime.tm_min
 			current_time = time.monotonic()
 			
-			# Calculate OVERALL progress (from schedule start, not segment start)
-			overall_elapsed = elapsed + (current_time - segment_start)
-			overall_progress = overall_elapsed / full_duration
-			current_column = int(Layout.PROGRESS_BAR_HORIZONTAL_WIDTH * overall_progress)
-			
 			# Update progress bar
-			if show_progress_bar and current_column != last_displayed_column and current_column < Layout.PROGRESS_BAR_HORIZONTAL_WIDTH:
-				update_progress_bar_bitmap(progress_bitmap, overall_elapsed, full_duration)
-				last_displayed_column = current_column
+			if show_progress_bar and current_time >= next_column_time:
+				overall_elapsed = elapsed + (current_time - segment_start)
+				current_column = int(bar_width * overall_elapsed / full_duration)
+				if current_column < bar_width:
+					painted_width = update_progress_bar_bitmap(progress_bitmap, current_column, painted_width)
+				next_column_time = segment_start + (painted_width + 1) * seconds_per_column - elapsed
 			
-			# Update clock
-			if current_minute != last_minute:
-				hour = rtc.datetime.tm_hour
-				display_hour = get_12h_hour(hour)
-				time_label.text = f"{display_hour}:{current_minute:02d}"
-				last_minute = current_minute
+			# Update clock - only read the RTC (I2C) once the next minute boundary is due
+			if current_time >= next_minute_check:
+				now = rtc.datetime
+				current_minute = now.tm_min
+				# Schedule the next read for just after the minute rolls over
+				next_minute_check = current_time + System.SECONDS_PER_MINUTE - now.tm_sec
+				
+				if current_minute != last_minute:
+					time_label.text = format_clock_time(now.tm_hour, current_minute)
+					last_minute = current_minute
 
 			interruptible_sleep(sleep_interval)
 		
@@ -5418,13 +5910,23 @@ def show_scheduled_display(rtc, schedule_name, schedule_config, total_duration,
 	
 	finally:
 		# Cleanup after segment
-		gc.collect()
+		maybe_gc()
 		
 		# Return segment info
 		# return is_last_segment # Boolean - is this last segment of schedule display
 
 ### SYSTEM MANAGEMENT ###
 
+def maybe_gc(threshold=Memory.GC_ALLOCATION_THRESHOLD):
+	"""Collect only if enough has been allocated since the last collection"""
+	free = gc.mem_free()
+	if free > state.last_gc_free:
+		# Memory was reclaimed elsewhere - measure from the new level
+		state.last_gc_free = free
+	elif state.last_gc_free - free > threshold:
+		gc.collect()
+		state.last_gc_free = gc.mem_free()
+
 def check_daily_reset(rtc):
 	"""Handle daily reset and cleanup operations"""
 	if not DAILY_RESET_ENABLED:
@@ -5433,13 +5935,11 @@ def check_daily_reset(rtc):
 	current_time = time.monotonic()
 	hours_running = (current_time - state.startup_time) / System.SECONDS_PER_HOUR
 	
-	# Scheduled restart conditions
-	should_restart = (
-		hours_running > System.HOURS_BEFORE_DAILY_RESTART or
-		(hours_running > System.MINIMUM_RUNTIME_BEFORE_RESTART and 
-		rtc.datetime.tm_hour == Timing.DAILY_RESET_HOUR and 
-		rtc.datetime.tm_min < System.RESTART_GRACE_MINUTES)
-	)
+	# Scheduled restart conditions (the RTC is only read once the minimum runtime has passed)
+	should_restart = hours_running > System.HOURS_BEFORE_DAILY_RESTART
+	if not should_restart and hours_running > System.MINIMUM_RUNTIME_BEFORE_RESTART:
+		now = rtc.datetime
+		should_restart = now.tm_hour == Timing.DAILY_RESET_HOUR and now.tm_min < System.RESTART_GRACE_MINUTES
 	
 	if should_restart:
 		log_info(f"Daily restart triggered ({hours_running:.1f}h runtime)")
@@ -5467,18 +5967,20 @@ def calculate_weekday(year, month, day):
 	# Convert Zeller's result (0=Saturday) to tm_wday format (0=Monday)
 	# Zeller: 0=Sat, 1=Sun, 2=Mon, 3=Tue, 4=Wed, 5=Thu, 6=Fri
 	# tm_wday: 0=Mon, 1=Tue, 2=Wed, 3=Thu, 4=Fri, 5=Sat, 6=Sun
-	weekday_conversion = {0: 5, 1: 6, 2: 0, 3: 1, 4: 2, 5: 3, 6: 4}
-	return weekday_conversion[h]
+	# Shifting by 5 (mod 7) maps one onto the other without a lookup table
+	return (h + 5) % 7
 		
+# Days before the start of each month (regular and leap years)
+_CUMULATIVE_DAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_CUMULATIVE_DAYS_LEAP = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
 def calculate_yearday(year, month, day):
 	"""Calculate day of year (1-366)"""
-	days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-	
 	# Check for leap year
 	if (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0):
-		days_in_month[1] = 29
+		return _CUMULATIVE_DAYS_LEAP[month - 1] + day
 	
-	return sum(days_in_month[:month-1]) + day
+	return _CUMULATIVE_DAYS[month - 1] + day
 		
 def update_rtc_datetime(rtc, new_year=None, new_month=None, new_day=None, new_hour=None, new_minute=None):
 	"""Update RTC date and optionally time"""
@@ -5540,9 +6042,7 @@ def calculate_market_hours_offset():
 		now = state.rtc_instance.datetime
 	else:
 		# Fallback: use arbitrary date if RTC not available
-		import time
-		t = time.localtime()
-		now = t
+		now = time.localtime()
 
 	# Calculate offset from local to ET (in hours)
 	user_offset = get_timezone_offset(user_timezone, now)
@@ -5636,6 +6136,7 @@ def initialize_system(rtc):
 	# Detect matrix type and initialize colors
 	matrix_type = detect_matrix_type()
 	state.colors = get_matrix_colors()
+	state.color_lut = build_color_lut(state.colors)
 	state.memory_monitor.check_memory("hardware_init_complete")
 	
 	# Handle test date if configured
@@ -5658,11 +6159,11 @@ def initialize_system(rtc):
 
 	# Initialize stocks
 	if github_stocks:
-		state.cached_stocks = github_stocks
+		set_cached_stocks(github_stocks)
 		log_debug(f"GitHub stocks: {len(github_stocks)} ticker(s)")
 	else:
 		log_warning("Failed to fetch stocks from GitHub, loading local stocks.csv")
-		state.cached_stocks = load_stocks_from_csv()
+		set_cached_stocks(load_stocks_from_csv())
 	
 	# Load all events (this will merge GitHub + permanent and set counters)
 	events = load_all_events()
@@ -5678,7 +6179,7 @@ def initialize_system(rtc):
 	if github_schedules:
 		scheduled_display.schedules = github_schedules
 		scheduled_display.schedules_loaded = True
-		scheduled_display.last_fetch_date = f"{rtc.datetime.tm_year:04d}-{rtc.datetime.tm_mon:02d}-{rtc.datetime.tm_mday:02d}"
+		scheduled_display.last_fetch_date = format_date_str(rtc.datetime)
 		
 		# Set flag based on source
 		if schedule_source == "date-specific":
@@ -5693,7 +6194,7 @@ def initialize_system(rtc):
 		if local_schedules:
 			scheduled_display.schedules = local_schedules
 			scheduled_display.schedules_loaded = True
-			scheduled_display.last_fetch_date = f"{rtc.datetime.tm_year:04d}-{rtc.datetime.tm_mon:02d}-{rtc.datetime.tm_mday:02d}"
+			scheduled_display.last_fetch_date = format_date_str(rtc.datetime)
 			schedule_source_flag = " (local)"
 			log_debug(f"Local schedules: {len(local_schedules)} schedule(s)")
 		else:
@@ -5702,19 +6203,19 @@ def initialize_system(rtc):
 	# Initialize stocks and track source
 	stock_source_flag = ""
 	if github_stocks:
-		state.cached_stocks = github_stocks
+		set_cached_stocks(github_stocks)
 		stock_source_flag = " (imported)"
 		log_info(f"GitHub stocks: {len(github_stocks)} symbols")
 	else:
 		log_verbose("Failed to fetch stocks from GitHub, trying local file")
 		local_stocks = load_stocks_from_csv()
 		if local_stocks:
-			state.cached_stocks = local_stocks
+			set_cached_stocks(local_stocks)
 			stock_source_flag = " (local)"
 			log_info(f"Local stocks: {len(local_stocks)} symbols")
 		else:
 			log_verbose("No stocks available")
-			state.cached_stocks = []
+			set_cached_stocks([])
 
 	# Load display configuration
 	log_debug("Loading display configuration...")
@@ -5783,7 +6284,8 @@ def setup_network_and_time(rtc):
 	if wifi_connected and not display_config.use_test_date:
 		location_info = sync_time_with_timezone(rtc)
 	elif display_config.use_test_date:
-		log_info(f"Manual Time Set: {rtc.datetime.tm_year:04d}/{rtc.datetime.tm_mon:02d}/{rtc.datetime.tm_mday:02d} {rtc.datetime.tm_hour:02d}:{rtc.datetime.tm_min:02d}")
+		now = rtc.datetime
+		log_info(f"Manual Time Set: {now.tm_year:04d}/{now.tm_mon:02d}/{now.tm_mday:02d} {now.tm_hour:02d}:{now.tm_min:02d}")
 		# location_info stays None
 	else:
 		log_warning("Starting without WiFi - using RTC time only")
@@ -5921,49 +6423,55 @@ def _run_scheduled_cycle(rtc, cycle_count, cycle_start_time):
 	# Check for events between schedules
 	log_debug(f"LAST SEGMENT -> {state.schedule_just_ended}")
 	if state.schedule_just_ended and display_config.show_events_in_between_schedules and display_config.show_events:
+		# cleanup_global_session() already collects when it tears down a session,
+		# so only collect again if something was allocated since
 		cleanup_global_session()
-		gc.collect()
+		maybe_gc()
 		show_event_display(rtc, 30)
 		cleanup_global_session()
-		gc.collect()
+		maybe_gc()
 
 	# Log cycle summary
-	cycle_duration = time.monotonic() - cycle_start_time
-	mem_stats = state.memory_monitor.get_memory_stats()
-	log_info(f"Cycle #{cycle_count} (SCHEDULED) complete in {cycle_duration/System.SECONDS_PER_MINUTE:.2f} min | UT: {state.memory_monitor.get_runtime()} | Mem: {mem_stats['usage_percent']:.1f}% | API: {state.tracker.get_api_stats()}\n")
+	_log_cycle_summary(cycle_count, time.monotonic() - cycle_start_time, "SCHEDULED")
 	return True
 
 def _run_normal_cycle(rtc, cycle_count, cycle_start_time):
 	"""Helper: Run normal display cycle (Category A2)"""
 	something_displayed = False
 
+	# Config flags and tracker are read several times below - bind them once
+	show_weather = display_config.show_weather
+	show_forecast = display_config.show_forecast
+	show_events = display_config.show_events
+	tracker = state.tracker
+
 	# Fetch data once
 	current_data, forecast_data, forecast_is_fresh = fetch_cycle_data(rtc)
 	current_duration, forecast_duration, event_duration = calculate_display_durations(rtc)
 
 	# Forecast display
 	forecast_shown = False
-	if display_config.show_forecast and current_data and forecast_data:
+	if show_forecast and current_data and forecast_data:
 		forecast_shown = show_forecast_display(current_data, forecast_data, forecast_duration, forecast_is_fresh)
 		something_displayed = something_displayed or forecast_shown
 		if forecast_shown:
-			state.tracker.record_weather_success()  # Weather-related display
+			tracker.record_weather_success()  # Weather-related display
 
 	if not forecast_shown:
 		current_duration += forecast_duration
 
 	# Weather display
-	if display_config.show_weather and current_data:
+	if show_weather and current_data:
 		show_weather_display(rtc, current_duration, current_data)
 		something_displayed = True
-		state.tracker.record_weather_success()  # Weather-related display
+		tracker.record_weather_success()  # Weather-related display
 
 	# Events display
-	if display_config.show_events and event_duration > 0:
+	if show_events and event_duration > 0:
 		event_shown = show_event_display(rtc, event_duration)
 		something_displayed = something_displayed or event_shown
 		if event_shown:
-			state.tracker.record_display_success()
+			tracker.record_display_success()
 		else:
 			interruptible_sleep(1)
 
@@ -5971,7 +6479,7 @@ def _run_normal_cycle(rtc, cycle_count, cycle_start_time):
 	# Display functions will handle market hours check and cache logic
 	if display_config.show_stocks:
 		# Smart frequency: show every cycle if stocks are the only display, otherwise respect frequency
-		other_displays_active = (display_config.show_weather or display_config.show_forecast or display_config.show_events)
+		other_displays_active = (show_weather or show_forecast or show_events)
 
 		if other_displays_active:
 			# Other displays active - respect frequency (e.g., frequency=3 means cycles 1, 4, 7, 10...)
@@ -5982,7 +6490,7 @@ def _run_normal_cycle(rtc, cycle_count, cycle_start_time):
 
 		if should_show_stocks:
 			# Smart rotation: Check if current stock is highlighted
-			display_mode, ticker = get_stock_display_mode(state.cached_stocks, state.tracker.current_stock_offset)
+			display_mode, ticker = get_stock_display_mode(state.cached_stocks, tracker.current_stock_offset)
 
 			if display_mode == "chart":
 				# Show single stock chart for highlighted stock
@@ -5990,15 +6498,15 @@ def _run_normal_cycle(rtc, cycle_count, cycle_start_time):
 				something_displayed = something_displayed or stocks_shown
 				if stocks_shown:
 					# Advance offset by 1 (move to next stock)
-					state.tracker.current_stock_offset = (state.tracker.current_stock_offset + 1) % len(state.cached_stocks)
-					state.tracker.record_display_success()
+					tracker.current_stock_offset = (tracker.current_stock_offset + 1) % len(state.cached_stocks)
+					tracker.record_display_success()
 			else:
 				# Show multi-stock rotation (3 stocks at a time)
-				stocks_shown, next_offset = show_stocks_display(Timing.DEFAULT_EVENT, state.tracker.current_stock_offset, rtc)
+				stocks_shown, next_offset = show_stocks_display(Timing.DEFAULT_EVENT, tracker.current_stock_offset, rtc)
 				something_displayed = something_displayed or stocks_shown
 				if stocks_shown:
-					state.tracker.current_stock_offset = next_offset  # Update for next display
-					state.tracker.record_display_success()
+					tracker.current_stock_offset = next_offset  # Update for next display
+					tracker.record_display_success()
 
 	# Transit display (with commute hours check if enabled)
 	if display_config.show_transit:
@@ -6013,7 +6521,7 @@ def _run_normal_cycle(rtc, cycle_count, cycle_start_time):
 			transit_shown = show_transit_display(rtc, Timing.DEFAULT_EVENT, current_data)
 			something_displayed = something_displayed or transit_shown
 			if transit_shown:
-				state.tracker.record_display_success()
+				tracker.record_display_success()
 
 	# Test modes
 	if display_config.show_color_test:
@@ -6042,13 +6550,21 @@ def _run_normal_cycle(rtc, cycle_count, cycle_start_time):
 		cycle_duration = time.monotonic() - cycle_start_time
 
 	# Log completion
-	mem_stats = state.memory_monitor.get_memory_stats()
-	log_info(f"Cycle #{cycle_count} complete in {cycle_duration/System.SECONDS_PER_MINUTE:.2f} min | UT: {state.memory_monitor.get_runtime()} | Mem: {mem_stats['usage_percent']:.1f}% | API: {state.tracker.get_api_stats()}\n")
+	_log_cycle_summary(cycle_count, cycle_duration)
+
+def _log_cycle_summary(cycle_count, cycle_duration, mode=None):
+	"""Helper: Log cycle completion with runtime, memory and API stats (Category A2)"""
+	if not INFO_ENABLED:
+		return  # Skip reading stats and building the line when INFO is filtered out
+	mode_tag = f" ({mode})" if mode else ""
+	usage_percent = int(state.memory_monitor.get_memory_stats()["usage_percent"])
+	log_info(f"Cycle #{cycle_count}{mode_tag} complete in {cycle_duration/System.SECONDS_PER_MINUTE:.2f} min | UT: {state.memory_monitor.get_runtime()} | Mem: {usage_percent}% | API: {state.tracker.get_api_stats()}\n")
 
 def _log_cycle_complete(cycle_count, cycle_start_time, mode):
 	"""Helper: Log cycle completion (Category A2)"""
+	if not INFO_ENABLED:
+		return
 	cycle_duration = time.monotonic() - cycle_start_time
-	mem_stats = state.memory_monitor.get_memory_stats()
 	log_info(f"Cycle #{cycle_count} ({mode}) complete in {cycle_duration/System.SECONDS_PER_MINUTE:.2f} min\n")
 
 def run_display_cycle(rtc, cycle_count):
@@ -6117,6 +6633,18 @@ def main():
 		# Network setup - CAPTURE the return value!
 		location_info = setup_network_and_time(rtc)  # ← ADD location_info =
 		
+		# Boot-time objects (fonts, colors, caches, session) live for the whole run -
+		# freeze them where supported so later collections don't re-mark them
+		gc.collect()
+		if hasattr(gc, "freeze"):
+			gc.freeze()
+		
+		# Collect proactively once about a quarter of the free heap has been
+		# allocated, instead of only when an allocation fails (smaller, evenly
+		# spaced pauses and less fragmentation) - where the port supports it
+		if hasattr(gc, "threshold"):
+			gc.threshold(gc.mem_free() // 4 + gc.mem_alloc())
+		
 		# Set startup time
 		state.startup_time = time.monotonic()
 		state.tracker.last_successful_display = state.startup_time